@@ -143,10 +143,10 @@ async def derive_framework_requirements(
                 requirement_id=req_id,
                 bu_id=bu_id,
                 framework=framework_key,
-                control_id=control["control_id"],
-                applies_to_transitions=control["applies_to_transitions"],
-                requirement_level=control["requirement_level"],
-                evidence_type=control["evidence_type"],
+                control_id=control.control_id,
+                applies_to_transitions=list(control.applies_to_transitions),
+                requirement_level=control.requirement_level,
+                evidence_type=control.evidence_type,
             )
             created += 1
 
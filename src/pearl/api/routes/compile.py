@@ -16,6 +16,7 @@ from pearl.repositories.environment_profile_repo import EnvironmentProfileReposi
 from pearl.repositories.finding_repo import FindingRepository
 from pearl.repositories.org_baseline_repo import OrgBaselineRepository
 from pearl.services.compiler.context_compiler import compile_context
+from pearl.services.compiler.integrity import canonical_json, verify_detached_hash
 from pearl.services.id_generator import generate_id
 from pearl.workers.queue import enqueue_job
 
@@ -136,7 +137,8 @@ async def get_package_integrity(
     row = await repo.get_latest_by_project(project_id)
     if not row:
         return {"status": "missing", "package_id": None, "hash_valid": None,
-                "source_drift": None, "drift_details": [], "compiled_at": None,
+                "stale_canonicalization": None, "source_drift": None,
+                "drift_details": [], "compiled_at": None,
                 "days_since_compiled": None}
 
     pkg_dict = row.package_data
@@ -148,12 +150,14 @@ async def get_package_integrity(
     body_for_hash = json.loads(json.dumps(pkg_dict))  # deep copy
     body_for_hash.pop("integrity_hash", None)  # ACoP CIH field added after hash — exclude it
     body_for_hash["package_metadata"]["integrity"] = {"compiled_at": compiled_at_str}
-    canonical = json.dumps(body_for_hash, sort_keys=True, separators=(",", ":"))
-    computed_hash = hashlib.sha256(canonical.encode()).hexdigest()
-    hash_valid = stored_hash is not None and stored_hash == computed_hash
+    # Packages compiled before the orjson canonicalization change hash over
+    # stdlib-escaped bytes; verify_detached_hash accepts the legacy form so
+    # a serialization-format change never triggers a false BA-05 demotion.
+    hash_valid, stale_canonicalization = verify_detached_hash(stored_hash, body_for_hash)
 
     # BA-05: emit a finding and trigger auto-demotion when contract integrity is violated
     if not hash_valid:
+        computed_hash = hashlib.sha256(canonical_json(body_for_hash)).hexdigest()
         environment = pkg_dict.get("project_identity", {}).get("environment", "unknown")
         await _emit_ba_finding(
             db=db,
@@ -227,6 +231,7 @@ async def get_package_integrity(
         "compiled_at": compiled_at_str,
         "status": status,
         "hash_valid": hash_valid,
+        "stale_canonicalization": stale_canonicalization,
         "source_drift": bool(drift_details),
         "drift_details": drift_details,
         "days_since_compiled": days_since,
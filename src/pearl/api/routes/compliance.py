@@ -11,7 +11,7 @@ from pearl.scanning.baseline_package import (
     get_recommended_baseline,
     select_baseline_tier,
 )
-from pearl.scanning.policy.templates import get_policy_templates
+from pearl.scanning.policy import templates as policy_templates
 
 router = APIRouter(tags=["Compliance"])
 
@@ -124,7 +124,7 @@ async def list_policy_templates(
     """List AI security policy templates."""
     from pearl.scanning.types import PolicyCategory
 
-    registry = get_policy_templates()
+    registry = policy_templates.DEFAULT_REGISTRY
     if category:
         try:
             pc = PolicyCategory(category)
@@ -149,7 +149,7 @@ async def list_policy_templates(
 @router.get("/policy-templates/{template_id}", status_code=200)
 async def get_policy_template(template_id: str) -> dict:
     """Get policy template detail with rules."""
-    registry = get_policy_templates()
+    registry = policy_templates.DEFAULT_REGISTRY
     template = registry.get(template_id)
     if not template:
         raise NotFoundError("PolicyTemplate", template_id)
@@ -6,7 +6,6 @@ Internal MCP enforcement via FastAPI Depends() is unaffected — this is an addi
 facade for external consumers.
 """
 
-import hashlib
 import json
 
 from fastapi import APIRouter, Depends
@@ -15,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from pearl.dependencies import get_db
 from pearl.repositories.compiled_package_repo import CompiledPackageRepository
+from pearl.services.compiler.integrity import verify_detached_hash
 
 router = APIRouter(tags=["Enforcement"])
 
@@ -59,10 +59,11 @@ async def pre_call_check(
     body_for_hash = json.loads(json.dumps(pkg_data))
     body_for_hash.pop("integrity_hash", None)  # ACoP CIH field — exclude from hash
     body_for_hash["package_metadata"]["integrity"] = {"compiled_at": compiled_at_str}
-    canonical = json.dumps(body_for_hash, sort_keys=True, separators=(",", ":"))
-    computed_hash = hashlib.sha256(canonical.encode()).hexdigest()
+    # Legacy packages hash over stdlib-escaped bytes; verify_detached_hash
+    # accepts that form so pre-orjson contracts are not denied as tampered.
+    hash_valid, _stale = verify_detached_hash(stored_hash, body_for_hash)
 
-    if stored_hash is None or stored_hash != computed_hash:
+    if not hash_valid:
         return {
             "decision": "block",
             "reason": "contract_integrity_failure",
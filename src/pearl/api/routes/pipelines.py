@@ -8,6 +8,7 @@ from pearl.errors.exceptions import ConflictError, NotFoundError, ValidationErro
 from pearl.repositories.pipeline_repo import PromotionPipelineRepository
 from pearl.repositories.promotion_repo import PromotionGateRepository
 from pearl.services.id_generator import generate_id
+from pearl.services.promotion.gate_evaluator import invalidate_pipeline_cache
 
 router = APIRouter(tags=["Pipelines"])
 
@@ -73,6 +74,7 @@ async def create_pipeline(
         project_id=body.get("project_id"),
     )
     await db.commit()
+    invalidate_pipeline_cache()
     return _serialize_pipeline(pipeline)
 
 
@@ -106,6 +108,7 @@ async def update_pipeline(
         await _ensure_gates_for_stages(new_stages, db)
 
     await db.commit()
+    invalidate_pipeline_cache()
     return _serialize_pipeline(pipeline)
 
 
@@ -122,6 +125,7 @@ async def delete_pipeline(
         raise ConflictError("Cannot delete the active default pipeline")
     await repo.delete(pipeline_id)
     await db.commit()
+    invalidate_pipeline_cache()
 
 
 @router.post("/pipelines/{pipeline_id}/set-default", status_code=200)
@@ -135,6 +139,7 @@ async def set_default_pipeline(
         raise NotFoundError("Promotion pipeline", pipeline_id)
     await repo.set_default(pipeline_id)
     await db.commit()
+    invalidate_pipeline_cache()
     return {"pipeline_id": pipeline_id, "is_default": True}
 
 
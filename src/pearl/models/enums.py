@@ -58,6 +58,7 @@ class ExternalExposure(StrEnum):
 class HashAlgorithm(StrEnum):
     SHA256 = "sha256"
     SHA512 = "sha512"
+    BLAKE2B_128 = "blake2b-128"
 
 
 class ReferenceKind(StrEnum):
@@ -4,7 +4,7 @@ import hashlib
 import hmac as _hmac
 from datetime import datetime, timezone
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pearl.config import settings
@@ -150,6 +150,14 @@ class ContextReceiptRepository(BaseRepository):
     async def get(self, cr_id: str) -> ContextReceiptRow | None:
         return await self.get_by_id("cr_id", cr_id)
 
+    async def exists_for_project(self, project_id: str) -> bool:
+        """Check whether any receipt exists for a project without loading rows."""
+        stmt = select(
+            exists().where(ContextReceiptRow.project_id == project_id)
+        )
+        result = await self.session.execute(stmt)
+        return bool(result.scalar())
+
     async def get_by_commit(self, project_id: str, commit_hash: str) -> ContextReceiptRow | None:
         stmt = select(ContextReceiptRow).where(
             and_(
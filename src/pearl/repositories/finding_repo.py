@@ -1,6 +1,6 @@
 """Finding repository."""
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pearl.db.models.finding import FindingBatchRow, FindingRow
@@ -19,6 +19,18 @@ class FindingRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def create_many(self, rows: list[dict]) -> int:
+        """Bulk-insert findings with a single executemany statement.
+
+        All dicts must share the same keys. Returns the number of rows
+        inserted; callers needing per-row error isolation should fall
+        back to :meth:`BaseRepository.create` for the failed batch.
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(FindingRow), rows)
+        return len(rows)
+
     def _base_query(
         self,
         project_id: str,
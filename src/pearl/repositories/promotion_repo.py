@@ -46,6 +46,12 @@ class PromotionGateRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_many(self, gate_ids: list[str]) -> dict[str, PromotionGateRow]:
+        """Fetch multiple gates in one IN query, keyed by gate_id."""
+        stmt = select(PromotionGateRow).where(PromotionGateRow.gate_id.in_(gate_ids))
+        result = await self.session.execute(stmt)
+        return {row.gate_id: row for row in result.scalars()}
+
     async def list_all_defaults(self) -> list[PromotionGateRow]:
         """List all org-level default gates."""
         stmt = select(PromotionGateRow).where(PromotionGateRow.project_id.is_(None))
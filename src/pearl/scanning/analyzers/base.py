@@ -12,7 +12,7 @@ from pathlib import Path
 from pearl.scanning.types import AttackCategory, ComponentType, ScanSeverity
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzerFinding:
     """A finding from a scanner analyzer."""
 
@@ -33,7 +33,7 @@ class AnalyzerFinding:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzerResult:
     """Result from running an analyzer."""
 
@@ -8,7 +8,7 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 
 from pearl.scanning.types import AttackCategory, ComponentType, ScanSeverity
 from pearl.scanning.analyzers.context.patterns import (
@@ -435,14 +435,24 @@ class ContextAnalyzer:
             List of analysis results.
         """
         directory = Path(directory)
-        results = []
-
         pattern = "**/*" if recursive else "*"
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and self._is_context_file(file_path):
-                result = self.analyze_file(file_path)
-                results.append(result)
+        return self.analyze_files(
+            p for p in directory.glob(pattern) if p.is_file()
+        )
+
+    def analyze_files(self, files: Iterable[Path]) -> list[ContextAnalysisResult]:
+        """Analyze the context files among an already-collected file list.
+
+        Args:
+            files: Iterable of file paths (non-context files are skipped).
 
+        Returns:
+            List of analysis results.
+        """
+        results = []
+        for file_path in files:
+            if self._is_context_file(file_path):
+                results.append(self.analyze_file(file_path))
         return results
 
     def _is_context_file(self, file_path: Path) -> bool:
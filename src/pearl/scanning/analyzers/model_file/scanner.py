@@ -8,7 +8,7 @@ import structlog
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 
 from pearl.scanning.types import ScanSeverity
 
@@ -356,15 +356,25 @@ class ModelFileScanner:
             List of results for each model file found.
         """
         directory = Path(directory)
-        results = []
-
         # Find model files
         pattern = "**/*" if recursive else "*"
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and self._is_model_file(file_path):
-                result = self.scan_file(file_path)
-                results.append(result)
+        return self.scan_files(
+            p for p in directory.glob(pattern) if p.is_file()
+        )
+
+    def scan_files(self, files: Iterable[Path]) -> list[ModelFileResult]:
+        """Scan the model files among an already-collected file list.
+
+        Args:
+            files: Iterable of file paths (non-model files are skipped).
 
+        Returns:
+            List of results for each model file found.
+        """
+        results = []
+        for file_path in files:
+            if self._is_model_file(file_path):
+                results.append(self.scan_file(file_path))
         return results
 
     def _is_model_file(self, file_path: Path) -> bool:
@@ -9,7 +9,7 @@ import structlog
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from pearl.scanning.types import ScanSeverity
 
@@ -155,8 +155,14 @@ class RAGAnalyzer:
             return result
 
         # Find relevant files
-        python_files = list(path.rglob("*.py"))
-        for py_file in python_files:
+        return self.analyze_files(path.rglob("*.py"))
+
+    def analyze_files(self, files: Iterable[Path]) -> RAGAnalysisResult:
+        """Analyze the Python files among an already-collected file list."""
+        result = RAGAnalysisResult()
+        for py_file in files:
+            if py_file.suffix != ".py":
+                continue
             try:
                 file_result = self.analyze_file(py_file)
                 result.findings.extend(file_result.findings)
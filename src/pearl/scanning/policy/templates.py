@@ -4,13 +4,24 @@ Pre-built policy templates that can be applied to AI deployments
 based on security requirements and compliance needs.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any
+from enum import Enum
+from typing import Any, Final
+
+import orjson
 
 from pearl.scanning.types import AttackCategory, PolicyCategory, ScanSeverity
 
 
-@dataclass
+def _enum_default(obj: Any) -> Any:
+    """orjson fallback: serialize enum members as their values."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class PolicyRule:
     """A single rule within a policy."""
 
@@ -19,8 +30,28 @@ class PolicyRule:
     description: str
     condition: str  # Human-readable condition
     action: str  # What to do when condition is met
-    severity: ScanSeverity = ScanSeverity.MEDIUM
-    enabled: bool = True
+    severity: ScanSeverity
+    enabled: bool
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        description: str,
+        condition: str,
+        action: str,
+        severity: ScanSeverity = ScanSeverity.MEDIUM,
+        enabled: bool = True,
+    ) -> None:
+        # Hand-written to skip the generated dataclass __init__ dispatch;
+        # rules are built in bulk on the import path.
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "condition", condition)
+        object.__setattr__(self, "action", action)
+        object.__setattr__(self, "severity", severity)
+        object.__setattr__(self, "enabled", enabled)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -34,8 +65,14 @@ class PolicyRule:
             "enabled": self.enabled,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes, skipping the intermediate dict."""
+        return orjson.dumps(
+            self, default=_enum_default, option=orjson.OPT_SERIALIZE_DATACLASS
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True, init=False)
 class PolicyTemplate:
     """A complete policy template."""
 
@@ -43,22 +80,68 @@ class PolicyTemplate:
     name: str
     description: str
     category: PolicyCategory
-    version: str = "1.0.0"
+    version: str
 
     # Policy rules
-    rules: list[PolicyRule] = field(default_factory=list)
+    rules: tuple[PolicyRule, ...]
 
     # Configuration
-    config_schema: dict[str, Any] = field(default_factory=dict)
-    default_config: dict[str, Any] = field(default_factory=dict)
+    config_schema: dict[str, Any]
+    default_config: dict[str, Any]
 
     # Compliance mapping
-    compliance_frameworks: list[str] = field(default_factory=list)
-    mitigates: list[AttackCategory] = field(default_factory=list)
+    compliance_frameworks: list[str]
+    mitigates: list[AttackCategory]
 
     # Metadata
-    tags: list[str] = field(default_factory=list)
-    recommended_for: list[str] = field(default_factory=list)  # Industries/use cases
+    tags: list[str]
+    recommended_for: list[str]  # Industries/use cases
+
+    # Derived: O(1) framework membership (orjson/repr skip underscore fields)
+    _compliance_set: frozenset[str] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        description: str,
+        category: PolicyCategory,
+        version: str = "1.0.0",
+        rules: tuple[PolicyRule, ...] = (),
+        config_schema: dict[str, Any] | None = None,
+        default_config: dict[str, Any] | None = None,
+        compliance_frameworks: list[str] | None = None,
+        mitigates: list[AttackCategory] | None = None,
+        tags: list[str] | None = None,
+        recommended_for: list[str] | None = None,
+    ) -> None:
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "category", category)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "rules", rules)
+        object.__setattr__(
+            self, "config_schema", config_schema if config_schema is not None else {}
+        )
+        object.__setattr__(
+            self, "default_config", default_config if default_config is not None else {}
+        )
+        object.__setattr__(
+            self,
+            "compliance_frameworks",
+            compliance_frameworks if compliance_frameworks is not None else [],
+        )
+        object.__setattr__(
+            self, "_compliance_set", frozenset(self.compliance_frameworks)
+        )
+        object.__setattr__(self, "mitigates", mitigates if mitigates is not None else [])
+        object.__setattr__(self, "tags", tags if tags is not None else [])
+        object.__setattr__(
+            self,
+            "recommended_for",
+            recommended_for if recommended_for is not None else [],
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -77,6 +160,12 @@ class PolicyTemplate:
             "recommended_for": self.recommended_for,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes, skipping the intermediate dicts."""
+        return orjson.dumps(
+            self, default=_enum_default, option=orjson.OPT_SERIALIZE_DATACLASS
+        )
+
 
 class PolicyRegistry:
     """Registry of policy templates."""
@@ -84,14 +173,13 @@ class PolicyRegistry:
     def __init__(self) -> None:
         """Initialize the registry."""
         self._templates: dict[str, PolicyTemplate] = {}
-        self._by_category: dict[PolicyCategory, list[PolicyTemplate]] = {}
+        self._by_category: defaultdict[PolicyCategory, list[PolicyTemplate]] = (
+            defaultdict(list)
+        )
 
     def register(self, template: PolicyTemplate) -> None:
         """Register a policy template."""
         self._templates[template.id] = template
-
-        if template.category not in self._by_category:
-            self._by_category[template.category] = []
         self._by_category[template.category].append(template)
 
     def get(self, template_id: str) -> PolicyTemplate | None:
@@ -111,10 +199,247 @@ class PolicyRegistry:
         return [
             t
             for t in self._templates.values()
-            if framework in t.compliance_frameworks
+            if framework in t._compliance_set
         ]
 
 
+# Default policy rules, shared by every registry built from this module.
+# PolicyRule is frozen, so the instances are safe to share.
+_RULE_PI_SANITIZE_INPUT: Final[PolicyRule] = PolicyRule(
+    id="pi-sanitize-input",
+    name="Sanitize User Input",
+    description="All user inputs must be sanitized before model processing",
+    condition="User input received",
+    action="Apply input sanitization filter",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_PI_DETECT_PATTERNS: Final[PolicyRule] = PolicyRule(
+    id="pi-detect-patterns",
+    name="Detect Injection Patterns",
+    description="Block inputs containing known injection patterns",
+    condition="Input matches injection pattern",
+    action="Block request and log attempt",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_PI_SEPARATE_DATA: Final[PolicyRule] = PolicyRule(
+    id="pi-separate-data",
+    name="Separate Data from Instructions",
+    description="Clearly separate user data from system instructions",
+    condition="Building prompt with user data",
+    action="Use delimiters and structured prompts",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_PI_OUTPUT_VALIDATION: Final[PolicyRule] = PolicyRule(
+    id="pi-output-validation",
+    name="Validate Model Output",
+    description="Validate outputs have not been manipulated by injection",
+    condition="Model returns response",
+    action="Check for unexpected behaviors",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_DLP_SCAN_OUTPUT: Final[PolicyRule] = PolicyRule(
+    id="dlp-scan-output",
+    name="Scan Output for Sensitive Data",
+    description="Scan all model outputs for PII and sensitive data",
+    condition="Model generates output",
+    action="Apply DLP scanning",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_DLP_REDACT_PII: Final[PolicyRule] = PolicyRule(
+    id="dlp-redact-pii",
+    name="Redact PII",
+    description="Automatically redact detected PII from outputs",
+    condition="PII detected in output",
+    action="Redact and log",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_DLP_BLOCK_SECRETS: Final[PolicyRule] = PolicyRule(
+    id="dlp-block-secrets",
+    name="Block Secret Exposure",
+    description="Block outputs containing secrets or credentials",
+    condition="Secret pattern detected",
+    action="Block response completely",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_DLP_TRAINING_DATA: Final[PolicyRule] = PolicyRule(
+    id="dlp-training-data",
+    name="Protect Training Data",
+    description="Prevent extraction of training data",
+    condition="Extraction attempt detected",
+    action="Block and alert",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_AC_AUTHENTICATE: Final[PolicyRule] = PolicyRule(
+    id="ac-authenticate",
+    name="Require Authentication",
+    description="All requests must be authenticated",
+    condition="Request received",
+    action="Verify authentication token",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_AC_AUTHORIZE: Final[PolicyRule] = PolicyRule(
+    id="ac-authorize",
+    name="Check Authorization",
+    description="Verify user has permission for requested action",
+    condition="Authenticated request",
+    action="Check RBAC permissions",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_AC_SCOPE_LIMIT: Final[PolicyRule] = PolicyRule(
+    id="ac-scope-limit",
+    name="Limit Action Scope",
+    description="Limit what actions the model can perform per role",
+    condition="Model attempts action",
+    action="Verify action is in allowed scope",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_MS_VERIFY_SOURCE: Final[PolicyRule] = PolicyRule(
+    id="ms-verify-source",
+    name="Verify Model Source",
+    description="Verify models come from trusted sources",
+    condition="Model loaded",
+    action="Check signature and provenance",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_MS_SAFE_FORMAT: Final[PolicyRule] = PolicyRule(
+    id="ms-safe-format",
+    name="Use Safe Model Formats",
+    description="Only use safe serialization formats (reject pickle)",
+    condition="Loading model file",
+    action="Reject unsafe formats",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_MS_HASH_VERIFY: Final[PolicyRule] = PolicyRule(
+    id="ms-hash-verify",
+    name="Verify Model Hash",
+    description="Verify model file integrity via cryptographic hash",
+    condition="Before model use",
+    action="Compare hash to known good value",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_INF_NETWORK_ISOLATION: Final[PolicyRule] = PolicyRule(
+    id="inf-network-isolation",
+    name="Network Isolation",
+    description="Isolate AI workloads from general network",
+    condition="Deployment configuration",
+    action="Enforce network segmentation",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_INF_NO_PRIVILEGED: Final[PolicyRule] = PolicyRule(
+    id="inf-no-privileged",
+    name="No Privileged Containers",
+    description="Containers must not run in privileged mode",
+    condition="Container deployment",
+    action="Reject privileged containers",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_INF_RESOURCE_LIMITS: Final[PolicyRule] = PolicyRule(
+    id="inf-resource-limits",
+    name="Enforce Resource Limits",
+    description="All deployments must have memory and CPU limits",
+    condition="Deployment configuration",
+    action="Require resource limits",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_CM_PERIODIC_SCAN: Final[PolicyRule] = PolicyRule(
+    id="cm-periodic-scan",
+    name="Periodic Compliance Scans",
+    description="Run automated compliance scans on a regular schedule",
+    condition="Scan schedule triggered",
+    action="Execute compliance scan and report results",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_CM_DRIFT_DETECTION: Final[PolicyRule] = PolicyRule(
+    id="cm-drift-detection",
+    name="Compliance Drift Detection",
+    description="Detect when configurations drift from compliant state",
+    condition="Configuration change detected",
+    action="Compare against compliance baseline and alert on drift",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_CM_EVIDENCE_COLLECTION: Final[PolicyRule] = PolicyRule(
+    id="cm-evidence-collection",
+    name="Evidence Collection",
+    description="Automatically collect and store compliance evidence",
+    condition="Compliance-relevant event occurs",
+    action="Archive evidence with timestamp and chain of custody",
+    severity=ScanSeverity.MEDIUM,
+)
+
+_RULE_ML_LOG_REQUESTS: Final[PolicyRule] = PolicyRule(
+    id="ml-log-requests",
+    name="Log All Requests",
+    description="Log all inference requests for audit",
+    condition="Request processed",
+    action="Write to secure log",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_ML_DETECT_ANOMALIES: Final[PolicyRule] = PolicyRule(
+    id="ml-detect-anomalies",
+    name="Detect Anomalies",
+    description="Monitor for anomalous usage patterns",
+    condition="Continuous monitoring",
+    action="Alert on anomalies",
+    severity=ScanSeverity.MEDIUM,
+)
+
+_RULE_ML_ALERT_VIOLATIONS: Final[PolicyRule] = PolicyRule(
+    id="ml-alert-violations",
+    name="Alert on Policy Violations",
+    description="Immediate alerts for security policy violations",
+    condition="Policy violation detected",
+    action="Send alert to security team",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_IR_CLASSIFY: Final[PolicyRule] = PolicyRule(
+    id="ir-classify",
+    name="Classify Incident",
+    description="Classify incidents by severity and type",
+    condition="Incident detected",
+    action="Apply classification matrix",
+    severity=ScanSeverity.HIGH,
+)
+
+_RULE_IR_CONTAIN: Final[PolicyRule] = PolicyRule(
+    id="ir-contain",
+    name="Contain Incident",
+    description="Immediately contain the incident to prevent spread",
+    condition="High severity incident",
+    action="Isolate affected systems",
+    severity=ScanSeverity.CRITICAL,
+)
+
+_RULE_IR_NOTIFY: Final[PolicyRule] = PolicyRule(
+    id="ir-notify",
+    name="Notify Stakeholders",
+    description="Notify appropriate stakeholders per escalation matrix",
+    condition="Incident classified",
+    action="Send notifications per escalation matrix",
+    severity=ScanSeverity.HIGH,
+)
+
+
 def get_policy_templates() -> PolicyRegistry:
     """Get registry with default policy templates."""
     registry = PolicyRegistry()
@@ -125,40 +450,12 @@ def get_policy_templates() -> PolicyRegistry:
         name="Prompt Injection Defense Policy",
         description="Comprehensive policy to prevent and detect prompt injection attacks.",
         category=PolicyCategory.PROMPT_SECURITY,
-        rules=[
-            PolicyRule(
-                id="pi-sanitize-input",
-                name="Sanitize User Input",
-                description="All user inputs must be sanitized before model processing",
-                condition="User input received",
-                action="Apply input sanitization filter",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="pi-detect-patterns",
-                name="Detect Injection Patterns",
-                description="Block inputs containing known injection patterns",
-                condition="Input matches injection pattern",
-                action="Block request and log attempt",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="pi-separate-data",
-                name="Separate Data from Instructions",
-                description="Clearly separate user data from system instructions",
-                condition="Building prompt with user data",
-                action="Use delimiters and structured prompts",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="pi-output-validation",
-                name="Validate Model Output",
-                description="Validate outputs have not been manipulated by injection",
-                condition="Model returns response",
-                action="Check for unexpected behaviors",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_PI_SANITIZE_INPUT,
+            _RULE_PI_DETECT_PATTERNS,
+            _RULE_PI_SEPARATE_DATA,
+            _RULE_PI_OUTPUT_VALIDATION,
+        ),
         default_config={
             "max_input_length": 4096,
             "block_on_detection": True,
@@ -177,40 +474,12 @@ def get_policy_templates() -> PolicyRegistry:
         name="Data Loss Prevention Policy",
         description="Prevent sensitive data from being exposed through model interactions.",
         category=PolicyCategory.DATA_PROTECTION,
-        rules=[
-            PolicyRule(
-                id="dlp-scan-output",
-                name="Scan Output for Sensitive Data",
-                description="Scan all model outputs for PII and sensitive data",
-                condition="Model generates output",
-                action="Apply DLP scanning",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="dlp-redact-pii",
-                name="Redact PII",
-                description="Automatically redact detected PII from outputs",
-                condition="PII detected in output",
-                action="Redact and log",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="dlp-block-secrets",
-                name="Block Secret Exposure",
-                description="Block outputs containing secrets or credentials",
-                condition="Secret pattern detected",
-                action="Block response completely",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="dlp-training-data",
-                name="Protect Training Data",
-                description="Prevent extraction of training data",
-                condition="Extraction attempt detected",
-                action="Block and alert",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_DLP_SCAN_OUTPUT,
+            _RULE_DLP_REDACT_PII,
+            _RULE_DLP_BLOCK_SECRETS,
+            _RULE_DLP_TRAINING_DATA,
+        ),
         default_config={
             "pii_types": ["ssn", "credit_card", "email", "phone", "address"],
             "secret_patterns": ["api_key", "password", "token", "secret"],
@@ -233,32 +502,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="Least Privilege Access Policy",
         description="Enforce minimum necessary permissions for AI system access.",
         category=PolicyCategory.ACCESS_CONTROL,
-        rules=[
-            PolicyRule(
-                id="ac-authenticate",
-                name="Require Authentication",
-                description="All requests must be authenticated",
-                condition="Request received",
-                action="Verify authentication token",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="ac-authorize",
-                name="Check Authorization",
-                description="Verify user has permission for requested action",
-                condition="Authenticated request",
-                action="Check RBAC permissions",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="ac-scope-limit",
-                name="Limit Action Scope",
-                description="Limit what actions the model can perform per role",
-                condition="Model attempts action",
-                action="Verify action is in allowed scope",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_AC_AUTHENTICATE,
+            _RULE_AC_AUTHORIZE,
+            _RULE_AC_SCOPE_LIMIT,
+        ),
         default_config={
             "auth_methods": ["jwt", "api_key"],
             "session_timeout_minutes": 30,
@@ -279,32 +527,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="Model Integrity Protection Policy",
         description="Protect model integrity from tampering and unauthorized modifications.",
         category=PolicyCategory.MODEL_SECURITY,
-        rules=[
-            PolicyRule(
-                id="ms-verify-source",
-                name="Verify Model Source",
-                description="Verify models come from trusted sources",
-                condition="Model loaded",
-                action="Check signature and provenance",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="ms-safe-format",
-                name="Use Safe Model Formats",
-                description="Only use safe serialization formats (reject pickle)",
-                condition="Loading model file",
-                action="Reject unsafe formats",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="ms-hash-verify",
-                name="Verify Model Hash",
-                description="Verify model file integrity via cryptographic hash",
-                condition="Before model use",
-                action="Compare hash to known good value",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_MS_VERIFY_SOURCE,
+            _RULE_MS_SAFE_FORMAT,
+            _RULE_MS_HASH_VERIFY,
+        ),
         default_config={
             "allowed_formats": ["safetensors", "onnx", "gguf"],
             "blocked_formats": ["pickle", "pkl", "pt", "pth"],
@@ -325,32 +552,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="Secure Deployment Policy",
         description="Security requirements for AI deployment infrastructure.",
         category=PolicyCategory.INFRASTRUCTURE,
-        rules=[
-            PolicyRule(
-                id="inf-network-isolation",
-                name="Network Isolation",
-                description="Isolate AI workloads from general network",
-                condition="Deployment configuration",
-                action="Enforce network segmentation",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="inf-no-privileged",
-                name="No Privileged Containers",
-                description="Containers must not run in privileged mode",
-                condition="Container deployment",
-                action="Reject privileged containers",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="inf-resource-limits",
-                name="Enforce Resource Limits",
-                description="All deployments must have memory and CPU limits",
-                condition="Deployment configuration",
-                action="Require resource limits",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_INF_NETWORK_ISOLATION,
+            _RULE_INF_NO_PRIVILEGED,
+            _RULE_INF_RESOURCE_LIMITS,
+        ),
         default_config={
             "require_tls": True,
             "min_tls_version": "1.3",
@@ -372,32 +578,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="Compliance Monitoring Policy",
         description="Continuous monitoring to ensure ongoing compliance with AI security frameworks.",
         category=PolicyCategory.COMPLIANCE,
-        rules=[
-            PolicyRule(
-                id="cm-periodic-scan",
-                name="Periodic Compliance Scans",
-                description="Run automated compliance scans on a regular schedule",
-                condition="Scan schedule triggered",
-                action="Execute compliance scan and report results",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="cm-drift-detection",
-                name="Compliance Drift Detection",
-                description="Detect when configurations drift from compliant state",
-                condition="Configuration change detected",
-                action="Compare against compliance baseline and alert on drift",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="cm-evidence-collection",
-                name="Evidence Collection",
-                description="Automatically collect and store compliance evidence",
-                condition="Compliance-relevant event occurs",
-                action="Archive evidence with timestamp and chain of custody",
-                severity=ScanSeverity.MEDIUM,
-            ),
-        ],
+        rules=(
+            _RULE_CM_PERIODIC_SCAN,
+            _RULE_CM_DRIFT_DETECTION,
+            _RULE_CM_EVIDENCE_COLLECTION,
+        ),
         default_config={
             "scan_frequency": "weekly",
             "frameworks": ["owasp_llm", "nist_ai_rmf"],
@@ -419,32 +604,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="Security Monitoring Policy",
         description="Requirements for monitoring AI systems for security events.",
         category=PolicyCategory.MONITORING,
-        rules=[
-            PolicyRule(
-                id="ml-log-requests",
-                name="Log All Requests",
-                description="Log all inference requests for audit",
-                condition="Request processed",
-                action="Write to secure log",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="ml-detect-anomalies",
-                name="Detect Anomalies",
-                description="Monitor for anomalous usage patterns",
-                condition="Continuous monitoring",
-                action="Alert on anomalies",
-                severity=ScanSeverity.MEDIUM,
-            ),
-            PolicyRule(
-                id="ml-alert-violations",
-                name="Alert on Policy Violations",
-                description="Immediate alerts for security policy violations",
-                condition="Policy violation detected",
-                action="Send alert to security team",
-                severity=ScanSeverity.CRITICAL,
-            ),
-        ],
+        rules=(
+            _RULE_ML_LOG_REQUESTS,
+            _RULE_ML_DETECT_ANOMALIES,
+            _RULE_ML_ALERT_VIOLATIONS,
+        ),
         default_config={
             "log_retention_days": 90,
             "alert_channels": ["email", "slack"],
@@ -466,32 +630,11 @@ def get_policy_templates() -> PolicyRegistry:
         name="AI Security Incident Response Policy",
         description="Procedures for responding to AI security incidents.",
         category=PolicyCategory.INCIDENT_RESPONSE,
-        rules=[
-            PolicyRule(
-                id="ir-classify",
-                name="Classify Incident",
-                description="Classify incidents by severity and type",
-                condition="Incident detected",
-                action="Apply classification matrix",
-                severity=ScanSeverity.HIGH,
-            ),
-            PolicyRule(
-                id="ir-contain",
-                name="Contain Incident",
-                description="Immediately contain the incident to prevent spread",
-                condition="High severity incident",
-                action="Isolate affected systems",
-                severity=ScanSeverity.CRITICAL,
-            ),
-            PolicyRule(
-                id="ir-notify",
-                name="Notify Stakeholders",
-                description="Notify appropriate stakeholders per escalation matrix",
-                condition="Incident classified",
-                action="Send notifications per escalation matrix",
-                severity=ScanSeverity.HIGH,
-            ),
-        ],
+        rules=(
+            _RULE_IR_CLASSIFY,
+            _RULE_IR_CONTAIN,
+            _RULE_IR_NOTIFY,
+        ),
         default_config={
             "escalation_matrix": {
                 "critical": ["security_lead", "ciso", "legal"],
@@ -512,3 +655,16 @@ def get_policy_templates() -> PolicyRegistry:
     ))
 
     return registry
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: build the shared default registry on first access.
+
+    Keeps registry construction off the import path for callers that
+    only need the dataclass/registry types.
+    """
+    if name == "DEFAULT_REGISTRY":
+        registry = get_policy_templates()
+        globals()["DEFAULT_REGISTRY"] = registry
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
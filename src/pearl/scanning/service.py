@@ -16,27 +16,26 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
+from collections import Counter, defaultdict
+from enum import Enum
+
 import structlog
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 from pearl.scanning.analyzers.base import AnalyzerFinding, AnalyzerResult
-from pearl.scanning.compliance.assessor import (
-    AssessmentResult,
-    ComplianceAssessor,
-)
-from pearl.scanning.findings_bridge import (
-    convert_analyzer_finding,
-    convert_multiple_results,
-)
-from pearl.scanning.policy.guardrails import (
-    Guardrail,
-    get_default_guardrails,
-)
 from pearl.scanning.types import AttackCategory, ComponentType, ScanSeverity
 
+if TYPE_CHECKING:
+    from pearl.scanning.compliance.assessor import AssessmentResult
+    from pearl.scanning.policy.guardrails import Guardrail
+
 logger = structlog.get_logger(__name__)
 
 
@@ -54,33 +53,113 @@ def _validate_scan_path(path: Path | str, allowed_root: str = "/") -> Path:
 # Analyzer registry — maps name → lazy-import callable
 # ---------------------------------------------------------------------------
 
-AVAILABLE_ANALYZERS: dict[str, str] = {
+AVAILABLE_ANALYZERS: Mapping[str, str] = MappingProxyType({
     "context": "pearl.scanning.analyzers.context.ContextAnalyzer",
     "mcp": "pearl.scanning.analyzers.mcp.MCPAnalyzer",
     "workflow": "pearl.scanning.analyzers.workflow.WorkflowAnalyzer",
     "attack_surface": "pearl.scanning.analyzers.attack_surface.AttackSurfaceAnalyzer",
     "rag": "pearl.scanning.analyzers.rag.RAGAnalyzer",
     "model_file": "pearl.scanning.analyzers.model_file.ModelFileScanner",
+})
+
+# Human-readable analyzer descriptions, surfaced by get_analyzer_info()
+_ANALYZER_DESCRIPTIONS = {
+    "context": "Scans system prompts, CLAUDE.md, .cursorrules for injection/exfiltration patterns",
+    "mcp": "Checks MCP server configs for injection, exfiltration, privilege escalation, rugpull",
+    "workflow": "Detects LangChain/CrewAI/AutoGen/LangGraph patterns, analyzes agent routing",
+    "attack_surface": "Maps attack vectors and vulnerability paths through AI system",
+    "rag": "Checks knowledge bases, vector stores for poisoning risks",
+    "model_file": "Checks .pt/.gguf/.bin/.safetensors for embedded code, poisoning",
 }
 
+_ANALYZER_NAMES: tuple[str, ...] = tuple(AVAILABLE_ANALYZERS)
+
+_ANALYZER_INFO: tuple[dict[str, str], ...] = tuple(
+    {"name": name, "description": _ANALYZER_DESCRIPTIONS.get(name, ""), "module": path}
+    for name, path in AVAILABLE_ANALYZERS.items()
+)
+
 # Analyzers that require outputs from other analyzers
-_META_ANALYZERS = {"attack_surface"}
+_META_ANALYZERS: frozenset[str] = frozenset({"attack_surface"})
+
+# MCP config files, matched by name during the shared directory walk
+_MCP_CONFIG_FILENAMES = frozenset({".mcp.json", "mcp_config.json", "mcp.json"})
+
+# Severity ordering used when tracking the worst finding per component
+_SEV_RANK = {"critical": 4, "high": 3, "medium": 2, "low": 1, "info": 0}
+
+# Caps on how much detail the threat model diagram receives
+_MAX_ATTACK_VECTORS = 50
+_MAX_VULN_PATHS = 20
 
 # File extensions each analyzer cares about
-_ANALYZER_FILE_HINTS = {
-    "context": {".md", ".txt", ".cursorrules"},
-    "mcp": {".json"},
-    "workflow": {".py", ".yaml", ".yml"},
-    "rag": {".py"},
-    "model_file": {
+_ANALYZER_FILE_HINTS: dict[str, frozenset[str]] = {
+    "context": frozenset({".md", ".txt", ".cursorrules"}),
+    "mcp": frozenset({".json"}),
+    "workflow": frozenset({".py", ".yaml", ".yml"}),
+    "rag": frozenset({".py"}),
+    "model_file": frozenset({
         ".pt", ".pth", ".bin", ".gguf", ".safetensors",
         ".onnx", ".pkl", ".pickle", ".h5", ".keras",
-    },
+    }),
+}
+
+# Finding category → guardrail types it calls for. Unknown categories
+# fall back to _DEFAULT_NEEDS.
+_CATEGORY_TO_NEEDS: dict[str, frozenset[str]] = {
+    "prompt_injection": frozenset({"input_validation", "content_moderation"}),
+    "jailbreak": frozenset({"input_validation", "content_moderation"}),
+    "system_prompt_leakage": frozenset({"input_validation", "content_moderation"}),
+    "sensitive_info": frozenset({"data_protection", "output_filtering"}),
+    "data_leakage": frozenset({"data_protection", "output_filtering"}),
+    "secrets_exposure": frozenset({"data_protection", "output_filtering"}),
+    "excessive_agency": frozenset({"access_control"}),
+    "privilege_escalation": frozenset({"access_control"}),
+    "unbounded_consumption": frozenset({"rate_limiting", "resource_limits"}),
+    "denial_of_service": frozenset({"rate_limiting", "resource_limits"}),
+    "supply_chain": frozenset({"model_protection"}),
+    "insecure_plugin": frozenset({"model_protection"}),
+    "data_model_poisoning": frozenset({"model_protection"}),
+    "bias": frozenset({"content_moderation", "output_filtering"}),
+    "toxicity": frozenset({"content_moderation", "output_filtering"}),
+    "misinformation": frozenset({"content_moderation", "output_filtering"}),
+    "hallucination": frozenset({"content_moderation", "output_filtering"}),
 }
+_DEFAULT_NEEDS = frozenset({"audit_logging"})
+
+
+def _enum_str(value: Any) -> str:
+    """Normalize an enum-or-string value to its string form.
+
+    A single C-level isinstance check, unlike the hasattr(.value) probe
+    this replaces on the per-finding hot paths.
+    """
+    return value.value if isinstance(value, Enum) else str(value)
+
 
+def _walk_once(target_path: Path) -> list[Path]:
+    """Collect all files under the target in a single directory walk.
 
+    Each analyzer runner used to re-glob the whole tree independently;
+    walking once per scan and sharing the listing avoids the repeated
+    stat() traffic.
+    """
+    if target_path.is_file():
+        return [target_path]
+    return [
+        Path(dirpath, fname)
+        for dirpath, _dirnames, filenames in os.walk(target_path)
+        for fname in filenames
+    ]
+
+
+@functools.lru_cache(maxsize=None)
 def _import_analyzer(dotted_path: str) -> type:
-    """Import an analyzer class from its dotted module path."""
+    """Import an analyzer class from its dotted module path.
+
+    Cached so each dotted path is resolved once per process; repeat scans
+    skip the importlib machinery entirely.
+    """
     module_path, class_name = dotted_path.rsplit(".", 1)
     import importlib
     module = importlib.import_module(module_path)
@@ -92,7 +171,7 @@ def _import_analyzer(dotted_path: str) -> type:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result from a complete scanning run."""
 
@@ -171,9 +250,27 @@ class ScanResult:
 class ScanningService:
     """Orchestrates AI security scanning within PeaRL."""
 
-    def __init__(self) -> None:
-        self._assessor = ComplianceAssessor()
-        self._guardrail_registry = get_default_guardrails()
+    @functools.cached_property
+    def _assessor(self) -> Any:
+        """Compliance assessor, constructed on first use."""
+        from pearl.scanning.compliance.assessor import ComplianceAssessor
+
+        return ComplianceAssessor()
+
+    @functools.cached_property
+    def _guardrail_registry(self) -> Any:
+        """Default guardrail registry, constructed on first use."""
+        from pearl.scanning.policy.guardrails import get_default_guardrails
+
+        return get_default_guardrails()
+
+    @functools.cached_property
+    def _guardrails_by_type(self) -> dict[str, list[Guardrail]]:
+        """Guardrails indexed by guardrail_type, built once per service."""
+        by_type: dict[str, list[Guardrail]] = defaultdict(list)
+        for guardrail in self._guardrail_registry.get_all():
+            by_type[_enum_str(guardrail.guardrail_type)].append(guardrail)
+        return by_type
 
     # ----- public API -----
 
@@ -213,19 +310,112 @@ class ScanningService:
         analyzers_run: list[str] = []
         errors: list[str] = []
 
-        # --- Phase 1: Run primary analyzers ---
+        # --- Phase 1: Run primary analyzers over one shared file listing ---
+        files = _walk_once(target_path)
+        target_is_file = target_path.is_file()
         for name in primary:
             if name not in AVAILABLE_ANALYZERS:
                 errors.append(f"Unknown analyzer: {name}")
                 continue
             try:
-                result = self._run_analyzer(name, target_path)
+                result = self._run_analyzer(name, target_path, files, target_is_file)
                 all_results.append(result)
                 analyzers_run.append(name)
             except Exception as exc:
                 logger.exception("Analyzer %s failed", name)
                 errors.append(f"{name}: {exc}")
 
+        return self._complete_scan(
+            scan_id=scan_id,
+            project_id=project_id,
+            environment=environment,
+            target_path=target_path,
+            started_at=started_at,
+            meta=meta,
+            all_results=all_results,
+            analyzers_run=analyzers_run,
+            errors=errors,
+        )
+
+    async def scan_target_async(
+        self,
+        target_path: Path | str,
+        project_id: str,
+        analyzers: list[str] | None = None,
+        environment: str = "dev",
+    ) -> ScanResult:
+        """Async variant of :meth:`scan_target` with concurrent phase 1.
+
+        Primary analyzers are independent and mostly I/O-bound (file walk
+        plus parse), so they run concurrently in threads via
+        :func:`asyncio.to_thread`. The meta phase stays serial because it
+        consumes phase-1 outputs.
+        """
+        from pearl.services.id_generator import generate_id
+
+        target_path = _validate_scan_path(target_path)  # codeql[py/path-injection]
+        scan_id = generate_id("scan_")
+        started_at = datetime.now(timezone.utc).isoformat()
+
+        requested = analyzers or list(AVAILABLE_ANALYZERS.keys())
+        primary = [a for a in requested if a not in _META_ANALYZERS]
+        meta = [a for a in requested if a in _META_ANALYZERS]
+
+        all_results: list[AnalyzerResult] = []
+        analyzers_run: list[str] = []
+        errors: list[str] = []
+
+        # --- Phase 1: Run primary analyzers concurrently ---
+        known = [name for name in primary if name in AVAILABLE_ANALYZERS]
+        errors.extend(
+            f"Unknown analyzer: {name}"
+            for name in primary
+            if name not in AVAILABLE_ANALYZERS
+        )
+        files = await asyncio.to_thread(_walk_once, target_path)
+        target_is_file = target_path.is_file()
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._run_analyzer, name, target_path, files, target_is_file
+                )
+                for name in known
+            ),
+            return_exceptions=True,
+        )
+        for name, outcome in zip(known, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Analyzer %s failed: %s", name, outcome)
+                errors.append(f"{name}: {outcome}")
+            else:
+                all_results.append(outcome)
+                analyzers_run.append(name)
+
+        return self._complete_scan(
+            scan_id=scan_id,
+            project_id=project_id,
+            environment=environment,
+            target_path=target_path,
+            started_at=started_at,
+            meta=meta,
+            all_results=all_results,
+            analyzers_run=analyzers_run,
+            errors=errors,
+        )
+
+    def _complete_scan(
+        self,
+        scan_id: str,
+        project_id: str,
+        environment: str,
+        target_path: Path,
+        started_at: str,
+        meta: list[str],
+        all_results: list[AnalyzerResult],
+        analyzers_run: list[str],
+        errors: list[str],
+    ) -> ScanResult:
+        """Run the meta phase and aggregation shared by both scan entrypoints."""
         # --- Phase 2: Run meta analyzers that consume phase-1 outputs ---
         for name in meta:
             if name not in AVAILABLE_ANALYZERS:
@@ -240,16 +430,13 @@ class ScanningService:
                 errors.append(f"{name}: {exc}")
 
         # --- Aggregate findings ---
-        all_findings: list[AnalyzerFinding] = []
-        findings_by_severity: dict[str, int] = {}
-        findings_by_analyzer: dict[str, int] = {}
-
-        for ar in all_results:
-            findings_by_analyzer[ar.analyzer_name] = len(ar.findings)
-            for f in ar.findings:
-                all_findings.append(f)
-                sev = f.severity.value if hasattr(f.severity, "value") else str(f.severity)
-                findings_by_severity[sev] = findings_by_severity.get(sev, 0) + 1
+        all_findings = [f for ar in all_results for f in ar.findings]
+        findings_by_analyzer = {
+            ar.analyzer_name: len(ar.findings) for ar in all_results
+        }
+        findings_by_severity = dict(
+            Counter(_enum_str(f.severity) for f in all_findings)
+        )
 
         # --- Compliance assessment ---
         compliance = self._assess_compliance(all_findings, scan_id)
@@ -282,6 +469,36 @@ class ScanningService:
             diagrams=diagrams,
         )
 
+    async def _persist_finding_rows(
+        self,
+        finding_repo,
+        to_insert: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """Persist finding rows with per-row error isolation.
+
+        Tries one savepoint-wrapped bulk insert first; if it fails, falls
+        back to per-row inserts, each in its own savepoint so a bad row
+        rolls back alone and leaves the session usable for the rest of the
+        batch. Returns ``(accepted, quarantined)`` counts.
+        """
+        session = finding_repo.session
+        accepted = 0
+        quarantined = 0
+        try:
+            async with session.begin_nested():
+                accepted = await finding_repo.create_many(to_insert)
+        except Exception as exc:
+            logger.warning("Bulk finding insert failed, retrying per-row: %s", exc)
+            for row in to_insert:
+                try:
+                    async with session.begin_nested():
+                        await finding_repo.create(**row)
+                    accepted += 1
+                except Exception as row_exc:
+                    logger.warning("Failed to persist finding: %s", row_exc)
+                    quarantined += 1
+        return accepted, quarantined
+
     async def scan_and_ingest(
         self,
         target_path: Path | str,
@@ -313,10 +530,11 @@ class ScanningService:
             FindingBatchRepository,
             FindingRepository,
         )
+        from pearl.scanning.findings_bridge import convert_multiple_results
         from pearl.services.id_generator import generate_id
 
-        # Step 1: Run the scan
-        result = self.scan_target(
+        # Step 1: Run the scan (primary analyzers run concurrently)
+        result = await self.scan_target_async(
             target_path=target_path,
             project_id=project_id,
             analyzers=analyzers,
@@ -327,89 +545,93 @@ class ScanningService:
         if not result.analyzer_results:
             return result
 
-        ingest_batch = convert_multiple_results(
-            results=result.analyzer_results,
-            project_id=project_id,
-            environment=environment,
-        )
+        # Clean scans (every analyzer ran, zero findings) need only the
+        # completion markers — skip the bridge conversion entirely.
+        if any(ar.findings for ar in result.analyzer_results):
+            ingest_batch = convert_multiple_results(
+                results=result.analyzer_results,
+                project_id=project_id,
+                environment=environment,
+            )
+        else:
+            ingest_batch = {
+                "source_batch": {
+                    "batch_id": generate_id("batch_"),
+                    "source_system": "pearl_scan",
+                    "trust_label": "trusted_internal",
+                },
+                "findings": [],
+            }
 
         batch_id = ingest_batch["source_batch"]["batch_id"]
 
-        # Step 3: Persist findings
+        # Step 3: Build all rows (findings + completion markers) up front
         finding_repo = FindingRepository(session)
-        accepted = 0
-        quarantined = 0
-
-        for finding_data in ingest_batch["findings"]:
-            try:
-                await finding_repo.create(
-                    finding_id=finding_data["finding_id"],
-                    project_id=finding_data["project_id"],
-                    environment=finding_data["environment"],
-                    category=finding_data["category"],
-                    severity=finding_data["severity"],
-                    title=finding_data["title"],
-                    source=finding_data["source"],
-                    full_data=finding_data,
-                    normalized=False,
-                    detected_at=datetime.fromisoformat(finding_data["detected_at"]),
-                    batch_id=batch_id,
-                    cwe_ids=finding_data.get("cwe_ids"),
-                    compliance_refs=finding_data.get("compliance_refs"),
-                    status=finding_data.get("status", "open"),
-                )
-                accepted += 1
-            except Exception as exc:
-                logger.warning("Failed to persist finding: %s", exc)
-                quarantined += 1
 
-        # Step 3b: Persist completion markers for analyzers with 0 findings.
-        # The gate evaluator derives completed_analyzers from findings, so
-        # analyzers that find nothing would appear as "not completed" without this.
-        analyzers_with_findings = set()
+        to_insert: list[dict[str, Any]] = []
+        analyzers_with_findings: set[str] = set()
         for finding_data in ingest_batch["findings"]:
+            to_insert.append({
+                "finding_id": finding_data["finding_id"],
+                "project_id": finding_data["project_id"],
+                "environment": finding_data["environment"],
+                "category": finding_data["category"],
+                "severity": finding_data["severity"],
+                "title": finding_data["title"],
+                "source": finding_data["source"],
+                "full_data": finding_data,
+                "normalized": False,
+                "detected_at": datetime.fromisoformat(finding_data["detected_at"]),
+                "batch_id": batch_id,
+                "cwe_ids": finding_data.get("cwe_ids"),
+                "compliance_refs": finding_data.get("compliance_refs"),
+                "status": finding_data.get("status", "open"),
+            })
             tool_name = finding_data.get("source", {}).get("tool_name", "")
             if tool_name.startswith("pearl_scan_"):
-                analyzers_with_findings.add(tool_name.replace("pearl_scan_", ""))
+                analyzers_with_findings.add(tool_name.removeprefix("pearl_scan_"))
 
+        # Completion markers for analyzers with 0 findings. The gate
+        # evaluator derives completed_analyzers from findings, so analyzers
+        # that find nothing would appear as "not completed" without this.
+        marker_now = datetime.now(timezone.utc)
+        marker_iso = marker_now.isoformat()
         for analyzer_name in result.analyzers_run:
             if analyzer_name not in analyzers_with_findings:
                 marker_id = generate_id("find_")
-                now_iso = datetime.now(timezone.utc).isoformat()
-                try:
-                    await finding_repo.create(
-                        finding_id=marker_id,
-                        project_id=project_id,
-                        environment=environment,
-                        category="security",
-                        severity="info",
-                        title=f"Scan completed: {analyzer_name} (0 issues found)",
-                        source={
-                            "tool_name": f"pearl_scan_{analyzer_name}",
-                            "tool_type": "pearl_ai",
-                            "trust_label": "trusted_internal",
-                        },
-                        full_data={
-                            "finding_id": marker_id,
-                            "title": f"Scan completed: {analyzer_name} (0 issues found)",
-                            "category": "security",
-                            "severity": "info",
-                            "status": "closed",
-                            "source": {
-                                "tool_name": f"pearl_scan_{analyzer_name}",
-                                "tool_type": "pearl_ai",
-                                "trust_label": "trusted_internal",
-                            },
-                            "detected_at": now_iso,
-                        },
-                        normalized=False,
-                        detected_at=datetime.now(timezone.utc),
-                        batch_id=batch_id,
-                        status="closed",
-                    )
-                    accepted += 1
-                except Exception as exc:
-                    logger.warning("Failed to persist analyzer marker: %s", exc)
+                source = {
+                    "tool_name": f"pearl_scan_{analyzer_name}",
+                    "tool_type": "pearl_ai",
+                    "trust_label": "trusted_internal",
+                }
+                to_insert.append({
+                    "finding_id": marker_id,
+                    "project_id": project_id,
+                    "environment": environment,
+                    "category": "security",
+                    "severity": "info",
+                    "title": f"Scan completed: {analyzer_name} (0 issues found)",
+                    "source": source,
+                    "full_data": {
+                        "finding_id": marker_id,
+                        "title": f"Scan completed: {analyzer_name} (0 issues found)",
+                        "category": "security",
+                        "severity": "info",
+                        "status": "closed",
+                        "source": source,
+                        "detected_at": marker_iso,
+                    },
+                    "normalized": False,
+                    "detected_at": marker_now,
+                    "batch_id": batch_id,
+                    "cwe_ids": None,
+                    "compliance_refs": None,
+                    "status": "closed",
+                })
+
+        # Step 3b: Bulk insert; fall back to per-row inserts on failure so
+        # one bad row quarantines only itself.
+        accepted, quarantined = await self._persist_finding_rows(finding_repo, to_insert)
 
         # Step 4: Create batch record
         batch_repo = FindingBatchRepository(session)
@@ -477,72 +699,84 @@ class ScanningService:
 
     # ----- private: individual analyzer runners -----
 
-    def _run_analyzer(self, name: str, target_path: Path) -> AnalyzerResult:
+    def _run_analyzer(
+        self,
+        name: str,
+        target_path: Path,
+        files: list[Path] | None = None,
+        is_file: bool | None = None,
+    ) -> AnalyzerResult:
         """Run a single primary analyzer and return its AnalyzerResult."""
         dotted = AVAILABLE_ANALYZERS[name]
         cls = _import_analyzer(dotted)
         analyzer = cls()
 
+        if files is None:
+            files = _walk_once(target_path)
+        if is_file is None:
+            is_file = target_path.is_file()
+
         if name == "context":
-            return self._run_context(analyzer, target_path)
+            return self._run_context(analyzer, target_path, files, is_file)
         elif name == "mcp":
-            return self._run_mcp(analyzer, target_path)
+            return self._run_mcp(analyzer, target_path, files, is_file)
         elif name == "workflow":
-            return self._run_workflow(analyzer, target_path)
+            return self._run_workflow(analyzer, target_path, files, is_file)
         elif name == "rag":
-            return self._run_rag(analyzer, target_path)
+            return self._run_rag(analyzer, target_path, files, is_file)
         elif name == "model_file":
-            return self._run_model_file(analyzer, target_path)
+            return self._run_model_file(analyzer, target_path, files, is_file)
         else:
             raise ValueError(f"No runner for analyzer: {name}")
 
-    def _run_context(self, analyzer: Any, target_path: Path) -> AnalyzerResult:
-        """Run context analyzer on directory."""
-        if target_path.is_file():
+    def _run_context(
+        self, analyzer: Any, target_path: Path, files: list[Path], is_file: bool
+    ) -> AnalyzerResult:
+        """Run context analyzer on the collected files."""
+        if is_file:
             results = [analyzer.analyze_file(target_path)]
         else:
-            results = analyzer.analyze_directory(target_path, recursive=True)
+            results = analyzer.analyze_files(files)
         return analyzer.to_analyzer_result(results)
 
-    def _run_mcp(self, analyzer: Any, target_path: Path) -> AnalyzerResult:
-        """Run MCP analyzer — searches for MCP config files."""
+    def _run_mcp(
+        self, analyzer: Any, target_path: Path, files: list[Path], is_file: bool
+    ) -> AnalyzerResult:
+        """Run MCP analyzer on MCP config files among the collected files."""
         all_results = []
-        if target_path.is_file():
+        if is_file:
             all_results.extend(analyzer.analyze_config_file(target_path))
         else:
-            # Search for MCP config files
-            mcp_patterns = [
-                "**/.mcp.json",
-                "**/mcp_config.json",
-                "**/mcp.json",
-                "**/.cursor/mcp.json",
-                "**/.vscode/mcp.json",
-            ]
-            for pattern in mcp_patterns:
-                for config_file in target_path.glob(pattern):
-                    try:
-                        results = analyzer.analyze_config_file(config_file)
-                        all_results.extend(results)
-                    except Exception as exc:
-                        logger.warning("MCP analysis failed for %s: %s", config_file, exc)
+            for config_file in files:
+                if config_file.name not in _MCP_CONFIG_FILENAMES:
+                    continue
+                try:
+                    results = analyzer.analyze_config_file(config_file)
+                    all_results.extend(results)
+                except Exception as exc:
+                    logger.warning("MCP analysis failed for %s: %s", config_file, exc)
         return analyzer.to_analyzer_result(all_results)
 
-    def _run_workflow(self, analyzer: Any, target_path: Path) -> AnalyzerResult:
-        """Run workflow analyzer — searches for Python/YAML files with framework imports."""
+    def _run_workflow(
+        self, analyzer: Any, target_path: Path, files: list[Path], is_file: bool
+    ) -> AnalyzerResult:
+        """Run workflow analyzer on Python/YAML files among the collected files."""
         all_results = []
-        if target_path.is_file():
+        if is_file:
             result = analyzer.analyze_file(target_path)
             all_results.append(result)
         else:
             # Scan Python and YAML files for workflow patterns
-            for ext in ("**/*.py", "**/*.yaml", "**/*.yml"):
-                for fpath in target_path.glob(ext):
-                    try:
-                        result = analyzer.analyze_file(fpath)
-                        if result.findings:
-                            all_results.append(result)
-                    except Exception:
-                        pass
+            hints = _ANALYZER_FILE_HINTS["workflow"]
+            for fpath in files:
+                if fpath.suffix not in hints:
+                    continue
+                try:
+                    result = analyzer.analyze_file(fpath)
+                    if result.findings:
+                        all_results.append(result)
+                except Exception as exc:
+                    logger.debug("Workflow analysis failed for %s: %s", fpath, exc)
         # Merge into single AnalyzerResult
         merged_findings: list[AnalyzerFinding] = []
         for wr in all_results:
@@ -553,20 +787,24 @@ class ScanningService:
             findings=merged_findings,
         )
 
-    def _run_rag(self, analyzer: Any, target_path: Path) -> AnalyzerResult:
-        """Run RAG analyzer on directory."""
-        if target_path.is_file():
+    def _run_rag(
+        self, analyzer: Any, target_path: Path, files: list[Path], is_file: bool
+    ) -> AnalyzerResult:
+        """Run RAG analyzer on Python files among the collected files."""
+        if is_file:
             result = analyzer.analyze_file(target_path)
         else:
-            result = analyzer.analyze_directory(target_path)
+            result = analyzer.analyze_files(files)
         return analyzer.to_analyzer_result(result)
 
-    def _run_model_file(self, analyzer: Any, target_path: Path) -> AnalyzerResult:
-        """Run model file scanner on directory."""
-        if target_path.is_file():
+    def _run_model_file(
+        self, analyzer: Any, target_path: Path, files: list[Path], is_file: bool
+    ) -> AnalyzerResult:
+        """Run model file scanner on model files among the collected files."""
+        if is_file:
             results = [analyzer.scan_file(target_path)]
         else:
-            results = analyzer.scan_directory(target_path)
+            results = analyzer.scan_files(files)
         return analyzer.to_analyzer_result(results)
 
     # ----- private: meta analyzers -----
@@ -608,15 +846,16 @@ class ScanningService:
                 components[comp_name] = comp_type
 
         # Add some default components if we found AI-related things
-        if any(ar.analyzer_name == "context" for ar in prior_results):
+        present = {ar.analyzer_name for ar in prior_results}
+        if "context" in present:
             components.setdefault("system_prompt", ComponentType.CONTEXT)
-        if any(ar.analyzer_name == "mcp" for ar in prior_results):
+        if "mcp" in present:
             components.setdefault("mcp_server", ComponentType.MCP_SERVER)
-        if any(ar.analyzer_name == "workflow" for ar in prior_results):
+        if "workflow" in present:
             components.setdefault("agent_workflow", ComponentType.WORKFLOW)
-        if any(ar.analyzer_name == "rag" for ar in prior_results):
+        if "rag" in present:
             components.setdefault("knowledge_base", ComponentType.KNOWLEDGE)
-        if any(ar.analyzer_name == "model_file" for ar in prior_results):
+        if "model_file" in present:
             components.setdefault("model", ComponentType.MODEL)
 
         # If no components were discovered, return empty result
@@ -644,21 +883,24 @@ class ScanningService:
         frameworks: list[str] | None = None,
     ) -> AssessmentResult:
         """Run compliance assessment on findings."""
-        # Convert AnalyzerFinding to the dict format the assessor expects
+        # Clean scans still go through the assessor: its empty-findings
+        # result (all requirements compliant) is part of the contract.
+        if not findings:
+            return self._assessor.assess([], scan_id=scan_id)
+
+        # Convert AnalyzerFinding to the dict format the assessor expects.
+        # Value→member maps coerce strings without the exception machinery
+        # of the enum constructor; unknown values pass through unchanged.
+        cat_members = AttackCategory._value2member_map_
+        sev_members = ScanSeverity._value2member_map_
         finding_dicts = []
         for f in findings:
             cat = f.category
             if isinstance(cat, str):
-                try:
-                    cat = AttackCategory(cat)
-                except ValueError:
-                    pass
+                cat = cat_members.get(cat, cat)
             sev = f.severity
             if isinstance(sev, str):
-                try:
-                    sev = ScanSeverity(sev)
-                except ValueError:
-                    pass
+                sev = sev_members.get(sev, sev)
             finding_dicts.append({
                 "category": cat,
                 "severity": sev,
@@ -673,44 +915,30 @@ class ScanningService:
         findings: list[AnalyzerFinding],
     ) -> list[Guardrail]:
         """Recommend guardrails based on finding categories."""
-        # Map finding categories to guardrail categories
-        category_needs: set[str] = set()
+        if not findings:
+            return []
 
+        # Map finding categories to guardrail categories via the
+        # module-level lookup table
+        category_needs: set[str] = set()
         for f in findings:
-            cat = f.category
-            cat_str = cat.value if hasattr(cat, "value") else str(cat)
-
-            if cat_str in ("prompt_injection", "jailbreak", "system_prompt_leakage"):
-                category_needs.add("input_validation")
-                category_needs.add("content_moderation")
-            elif cat_str in ("sensitive_info", "data_leakage", "secrets_exposure"):
-                category_needs.add("data_protection")
-                category_needs.add("output_filtering")
-            elif cat_str in ("excessive_agency", "privilege_escalation"):
-                category_needs.add("access_control")
-            elif cat_str in ("unbounded_consumption", "denial_of_service"):
-                category_needs.add("rate_limiting")
-                category_needs.add("resource_limits")
-            elif cat_str in ("supply_chain", "insecure_plugin", "data_model_poisoning"):
-                category_needs.add("model_protection")
-            elif cat_str in ("bias", "toxicity", "misinformation", "hallucination"):
-                category_needs.add("content_moderation")
-                category_needs.add("output_filtering")
-            else:
-                category_needs.add("audit_logging")
+            category_needs |= _CATEGORY_TO_NEEDS.get(
+                _enum_str(f.category), _DEFAULT_NEEDS
+            )
 
         # Always recommend audit logging if there are findings
         if findings:
             category_needs.add("audit_logging")
 
-        # Filter guardrails by guardrail_type
-        recommended = []
-        for guardrail in self._guardrail_registry.get_all():
-            gt = guardrail.guardrail_type
-            gt_str = gt.value if hasattr(gt, "value") else str(gt)
-            if gt_str in category_needs:
-                recommended.append(guardrail)
-
+        # Pull matching guardrails from the per-type index, deduplicating
+        # in case a guardrail is ever indexed under multiple needs
+        recommended: list[Guardrail] = []
+        seen: set[str] = set()
+        for need in sorted(category_needs):
+            for guardrail in self._guardrails_by_type.get(need, ()):
+                if guardrail.id not in seen:
+                    seen.add(guardrail.id)
+                    recommended.append(guardrail)
         return recommended
 
     # ----- private: diagrams -----
@@ -723,6 +951,9 @@ class ScanningService:
         environment: str,
     ) -> dict[str, str]:
         """Generate threat model and topology diagrams from scan results."""
+        if not analyzer_results:
+            return {}
+
         from pearl.scanning.diagrams.threat_model import generate_threat_model_diagram
         from pearl.scanning.diagrams.topology import generate_topology_diagram
 
@@ -733,33 +964,35 @@ class ScanningService:
         interactions_list: list[dict[str, Any]] = []
         attack_vectors: list[dict[str, Any]] = []
         vuln_paths: list[dict[str, Any]] = []
-        findings_by_component: dict[str, str] = {}
+        # Highest severity per component, tracked as (rank, label) so each
+        # update is one dict lookup against the precomputed _SEV_RANK table
+        component_severity: dict[str, tuple[int, str]] = {}
 
         for ar in analyzer_results:
             for f in ar.findings:
                 comp_name = f.component_name or f.file_path or ar.analyzer_name
                 comp_type = f.component_type
-                comp_type_str = comp_type.value if hasattr(comp_type, "value") else str(comp_type)
+                comp_type_str = _enum_str(comp_type)
                 components[comp_name] = comp_type_str
 
                 sev = f.severity
-                sev_str = sev.value if hasattr(sev, "value") else str(sev)
+                sev_str = _enum_str(sev)
 
                 # Track highest severity per component
-                sev_order = {"critical": 4, "high": 3, "medium": 2, "low": 1, "info": 0}
-                current = findings_by_component.get(comp_name, "info")
-                if sev_order.get(sev_str, 0) > sev_order.get(current, 0):
-                    findings_by_component[comp_name] = sev_str
-
-                # Build attack vectors from findings
-                cat = f.category
-                cat_str = cat.value if hasattr(cat, "value") else str(cat)
-                attack_vectors.append({
-                    "name": f.title[:80],
-                    "severity": sev_str,
-                    "target": comp_name,
-                    "category": cat_str,
-                })
+                new_rank = _SEV_RANK.get(sev_str, 0)
+                current = component_severity.get(comp_name)
+                if new_rank > (current[0] if current is not None else 0):
+                    component_severity[comp_name] = (new_rank, sev_str)
+
+                # Build attack vectors from findings, capped at the source
+                # so large scans do not allocate dicts the diagram drops
+                if len(attack_vectors) < _MAX_ATTACK_VECTORS:
+                    attack_vectors.append({
+                        "name": f.title[:80],
+                        "severity": sev_str,
+                        "target": comp_name,
+                        "category": _enum_str(f.category),
+                    })
 
         # Check for attack surface results
         for ar in analyzer_results:
@@ -773,8 +1006,8 @@ class ScanningService:
             try:
                 diagrams["threat_model"] = generate_threat_model_diagram(
                     components=components,
-                    attack_vectors=attack_vectors[:50],
-                    vulnerability_paths=vuln_paths[:20],
+                    attack_vectors=attack_vectors,
+                    vulnerability_paths=vuln_paths[:_MAX_VULN_PATHS],
                     interactions=interactions_list,
                     title=f"Threat Model — {project_id} ({environment})",
                 )
@@ -785,7 +1018,9 @@ class ScanningService:
                 diagrams["topology"] = generate_topology_diagram(
                     components=components,
                     interactions=interactions_list,
-                    findings_by_component=findings_by_component,
+                    findings_by_component={
+                        name: label for name, (_rank, label) in component_severity.items()
+                    },
                     title=f"AI Topology — {project_id} ({environment})",
                     environment=environment,
                 )
@@ -799,20 +1034,11 @@ class ScanningService:
     @staticmethod
     def list_available_analyzers() -> list[str]:
         """Return names of all available analyzers."""
-        return list(AVAILABLE_ANALYZERS.keys())
+        return list(_ANALYZER_NAMES)
 
     @staticmethod
     def get_analyzer_info() -> list[dict[str, str]]:
         """Return info about available analyzers."""
-        info = {
-            "context": "Scans system prompts, CLAUDE.md, .cursorrules for injection/exfiltration patterns",
-            "mcp": "Checks MCP server configs for injection, exfiltration, privilege escalation, rugpull",
-            "workflow": "Detects LangChain/CrewAI/AutoGen/LangGraph patterns, analyzes agent routing",
-            "attack_surface": "Maps attack vectors and vulnerability paths through AI system",
-            "rag": "Checks knowledge bases, vector stores for poisoning risks",
-            "model_file": "Checks .pt/.gguf/.bin/.safetensors for embedded code, poisoning",
-        }
-        return [
-            {"name": name, "description": info.get(name, ""), "module": path}
-            for name, path in AVAILABLE_ANALYZERS.items()
-        ]
+        # Shallow-copy the precomputed entries so callers can't mutate
+        # the shared constants
+        return [dict(entry) for entry in _ANALYZER_INFO]
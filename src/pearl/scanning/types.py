@@ -5,10 +5,38 @@ compliance frameworks, agentic frameworks, guardrail types,
 and policy categories used by the scanning subsystem.
 """
 
+import sys
 from enum import StrEnum
+from typing import Any, ClassVar
 
 
-class AttackCategory(StrEnum):
+class _FastStrEnum(StrEnum):
+    """StrEnum with an interned value→member table for hot lookups.
+
+    Member values are interned once at class creation so serialization
+    paths that coerce strings to members hit the dict fast path, and
+    ``from_value`` offers a non-raising single-lookup alternative to the
+    enum constructor.
+    """
+
+    _fast_map: ClassVar[dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fast = {
+            sys.intern(value): member
+            for value, member in cls._value2member_map_.items()
+        }
+        cls._value2member_map_ = fast
+        cls._fast_map = fast
+
+    @classmethod
+    def from_value(cls, value: str, default: Any = None) -> Any:
+        """Return the member for ``value``, or ``default`` if unknown."""
+        return cls._fast_map.get(value, default)
+
+
+class AttackCategory(_FastStrEnum):
     """Attack and vulnerability categories.
 
     Aligned with OWASP LLM Top 10 2025 and extended with
@@ -40,7 +68,7 @@ class AttackCategory(StrEnum):
     DENIAL_OF_SERVICE = "denial_of_service"
 
 
-class ComponentType(StrEnum):
+class ComponentType(_FastStrEnum):
     """Deployment component types."""
 
     MODEL = "model"
@@ -56,7 +84,7 @@ class ComponentType(StrEnum):
     GUARDRAILS = "guardrails"
 
 
-class ScanSeverity(StrEnum):
+class ScanSeverity(_FastStrEnum):
     """Finding severity classification.
 
     Named ScanSeverity to avoid collision with PeaRL's existing RiskLevel.
@@ -69,7 +97,7 @@ class ScanSeverity(StrEnum):
     INFO = "info"
 
 
-class FrameworkType(StrEnum):
+class FrameworkType(_FastStrEnum):
     """Compliance framework types."""
 
     OWASP_LLM = "owasp_llm"
@@ -78,7 +106,7 @@ class FrameworkType(StrEnum):
     EU_AI_ACT = "eu_ai_act"
 
 
-class AgenticFramework(StrEnum):
+class AgenticFramework(_FastStrEnum):
     """Supported agentic AI frameworks."""
 
     LANGCHAIN = "langchain"
@@ -92,7 +120,7 @@ class AgenticFramework(StrEnum):
     CUSTOM = "custom"
 
 
-class GuardrailType(StrEnum):
+class GuardrailType(_FastStrEnum):
     """Types of guardrails."""
 
     INPUT_VALIDATION = "input_validation"
@@ -107,7 +135,7 @@ class GuardrailType(StrEnum):
     NETWORK_SEGMENTATION = "network_segmentation"
 
 
-class GuardrailSeverity(StrEnum):
+class GuardrailSeverity(_FastStrEnum):
     """Severity if guardrail is violated."""
 
     CRITICAL = "critical"
@@ -117,7 +145,7 @@ class GuardrailSeverity(StrEnum):
     ADVISORY = "advisory"
 
 
-class PolicyCategory(StrEnum):
+class PolicyCategory(_FastStrEnum):
     """Categories of security policies."""
 
     PROMPT_SECURITY = "prompt_security"
@@ -130,7 +158,7 @@ class PolicyCategory(StrEnum):
     INCIDENT_RESPONSE = "incident_response"
 
 
-class RequirementStatus(StrEnum):
+class RequirementStatus(_FastStrEnum):
     """Status of a compliance requirement."""
 
     COMPLIANT = "compliant"
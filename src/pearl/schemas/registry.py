@@ -1,5 +1,7 @@
 """Schema registry mapping logical names to file paths."""
 
+import sys
+
 # Maps logical schema names to relative paths under PeaRL_spec/schemas/
 SCHEMA_REGISTRY: dict[str, str] = {
     # Common
@@ -44,3 +46,10 @@ EXAMPLE_SCHEMA_PAIRS: list[tuple[str, str]] = [
     ("reports/generate-report.request.json", "workflow/report-request.schema.json"),
     ("reports/generate-report.response.json", "workflow/report-response.schema.json"),
 ]
+
+# Intern registry strings so lookups keyed on them compare by pointer
+SCHEMA_REGISTRY = {sys.intern(k): sys.intern(v) for k, v in SCHEMA_REGISTRY.items()}
+EXAMPLE_SCHEMA_PAIRS = [
+    (sys.intern(example), sys.intern(schema))
+    for example, schema in EXAMPLE_SCHEMA_PAIRS
+]
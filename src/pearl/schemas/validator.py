@@ -1,26 +1,125 @@
 """Schema validation service using jsonschema library."""
 
+import sys
 from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 
 import jsonschema
 
-from pearl.schemas.loader import load_json, make_ref_handlers
+from pearl.schemas.loader import load_json
 from pearl.schemas.registry import SCHEMA_REGISTRY
 
 
+def _json_pointer(doc: dict, fragment: str):
+    """Walk a '#/a/b' style JSON pointer fragment into a document."""
+    node = doc
+    for part in fragment.lstrip("/").split("/"):
+        if not part:
+            continue
+        part = part.replace("~1", "/").replace("~0", "~")
+        node = node[int(part)] if isinstance(node, list) else node[part]
+    return node
+
+
 class SchemaValidator:
-    """Validates JSON instances against PeaRL JSON Schemas."""
+    """Validates JSON instances against PeaRL JSON Schemas.
+
+    Schemas are loaded once per path and all ``$ref`` links (pearl.local
+    URIs, relative file refs, and same-document pointers) are inlined at
+    load time, so validation needs no resolver and costs only what the
+    instance itself costs.
+    """
 
     def __init__(self, spec_dir: str | Path = "PeaRL_spec"):
         self.spec_dir = Path(spec_dir).resolve()
         self.schema_dir = self.spec_dir / "schemas"
         self.examples_dir = self.spec_dir / "examples"
+        # Interned registry paths make every cache-key compare a pointer
+        # compare on the hot validate() path
+        self._interned = {k: sys.intern(v) for k, v in SCHEMA_REGISTRY.items()}
 
-    @lru_cache(maxsize=32)
+    @lru_cache(maxsize=None)
     def _load_schema(self, schema_rel: str) -> dict:
-        """Load and cache a schema by its relative path under schemas/."""
-        return load_json(self.schema_dir / schema_rel)
+        """Load and cache a raw (unresolved) schema by relative path."""
+        return self._load_schema_file((self.schema_dir / schema_rel).resolve())
+
+    @lru_cache(maxsize=None)
+    def _load_schema_file(self, path: Path) -> dict:
+        """Load and cache a raw schema document by absolute path."""
+        return load_json(path)
+
+    @lru_cache(maxsize=None)
+    def _resolved_schema(self, schema_rel: str) -> dict:
+        """Load a schema with every reachable ``$ref`` inlined.
+
+        Resolved subschemas are shared structurally via a per-call memo,
+        and cyclic references are left as-is rather than expanded.
+        """
+        schema_path = (self.schema_dir / schema_rel).resolve()
+        memo: dict[tuple[Path, str], dict | list] = {}
+        return self._inline_refs(
+            self._load_schema(schema_rel), schema_path, frozenset(), memo
+        )
+
+    def _ref_target(self, uri: str, doc_path: Path) -> tuple[Path, str]:
+        """Resolve a ``$ref`` URI to (absolute schema file, fragment)."""
+        path_part, _, fragment = uri.partition("#")
+        if not path_part:
+            return doc_path, fragment
+        parsed = urlparse(path_part)
+        if parsed.scheme in ("http", "https"):
+            if parsed.netloc == "pearl.local" and parsed.path.startswith("/schemas/"):
+                local_rel = parsed.path[len("/schemas/"):]
+                return (self.schema_dir / local_rel).resolve(), fragment
+            raise FileNotFoundError(f"Unsupported remote schema URI: {uri}")
+        return (doc_path.parent / path_part).resolve(), fragment
+
+    def _inline_refs(self, node, doc_path: Path, expanding: frozenset, memo: dict):
+        """Recursively splice resolved ``$ref`` targets into a schema tree."""
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                target_path, fragment = self._ref_target(ref, doc_path)
+                key = (target_path, fragment)
+                if key in expanding:
+                    # Cycle: leave the reference unexpanded
+                    return node
+                if key in memo:
+                    resolved = memo[key]
+                else:
+                    target_doc = self._load_schema_file(target_path)
+                    target = _json_pointer(target_doc, fragment)
+                    resolved = self._inline_refs(
+                        target, target_path, expanding | {key}, memo
+                    )
+                    memo[key] = resolved
+                if len(node) == 1:
+                    return resolved
+                # $ref with sibling keywords: siblings override the target
+                merged = dict(resolved)
+                merged.update((k, v) for k, v in node.items() if k != "$ref")
+                return merged
+            return {
+                k: self._inline_refs(v, doc_path, expanding, memo)
+                for k, v in node.items()
+            }
+        if isinstance(node, list):
+            return [self._inline_refs(v, doc_path, expanding, memo) for v in node]
+        return node
+
+    @lru_cache(maxsize=64)
+    def _validator_for(self, schema_rel: str) -> jsonschema.protocols.Validator:
+        """Compiled validator for a schema, built once and reused.
+
+        The validator class is chosen from the schema's ``$schema``
+        declaration (Draft 7 default, matching the previous behaviour of
+        :func:`jsonschema.validate`).
+        """
+        schema = self._resolved_schema(schema_rel)
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        return cls(schema)
 
     def validate(self, instance: dict, schema_name: str) -> None:
         """Validate an instance against a named schema.
@@ -33,7 +132,7 @@ class SchemaValidator:
             KeyError: If schema_name not in registry.
             jsonschema.ValidationError: If validation fails.
         """
-        schema_rel = SCHEMA_REGISTRY[schema_name]
+        schema_rel = self._interned[schema_name]
         self.validate_by_path(instance, schema_rel)
 
     def validate_by_path(self, instance: dict, schema_rel: str) -> None:
@@ -46,8 +145,6 @@ class SchemaValidator:
         Raises:
             jsonschema.ValidationError: If validation fails.
         """
-        schema_path = self.schema_dir / schema_rel
-        schema = self._load_schema(schema_rel)
-        handlers = make_ref_handlers(schema_path.parent, self.schema_dir)
-        resolver = jsonschema.RefResolver.from_schema(schema, handlers=handlers)
-        jsonschema.validate(instance=instance, schema=schema, resolver=resolver)
+        error = next(self._validator_for(schema_rel).iter_errors(instance), None)
+        if error is not None:
+            raise error
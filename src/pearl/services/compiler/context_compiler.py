@@ -1,7 +1,6 @@
 """Context compilation engine - merges org-baseline + app-spec + environment-profile."""
 
 import hashlib
-import json
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -35,8 +34,60 @@ from pearl.repositories.environment_profile_repo import EnvironmentProfileReposi
 from pearl.repositories.exception_repo import ExceptionRepository
 from pearl.repositories.org_baseline_repo import OrgBaselineRepository
 from pearl.repositories.project_repo import ProjectRepository
+from pearl.services.compiler.integrity import canonical_json
 from pearl.services.id_generator import generate_id
 
+# Static package content, shared across compiles (Pydantic copies
+# sequences into fresh lists at model construction)
+_EVIDENCE_REQUIREMENTS = (
+    "decision_trace", "test_results", "approval_records", "artifact_versions",
+)
+_ARCHITECTURE_DELTA_TRIGGERS = (
+    "new_external_integration", "new_trust_boundary",
+    "data_classification_change", "auth_flow_change",
+)
+_APPROVAL_REQUIRED_FOR = (
+    "auth_flow_changes", "network_policy_changes", "data_retention_changes",
+)
+_NETWORK_OUTBOUND_ALLOWLIST = ("llm-gateway.internal", "telemetry.internal")
+_ALLOWED_TOOL_CLASSES = ("repo_edit", "tests", "static_analysis")
+_FORBIDDEN_TOOL_CLASSES = ("prod_admin",)
+_SECURITY_TESTS = (
+    "authz_negative_tests", "prompt_injection_guardrail_tests",
+    "sensitive_data_leakage_tests",
+)
+_RAI_TESTS = ("ai_disclosure_presence_test", "explanation_metadata_presence_test")
+_FUNCTIONAL_TESTS = ("critical-path-smoke-test",)
+
+# Approval checkpoints per level as (checkpoint_id, trigger, base_roles);
+# levels are cumulative, unknown levels fall back to the deployment gate
+_CP_DEPLOYMENT_GATE = ("cp_deployment_gate", "deployment_gate", ("platform_owner",))
+_CP_AUTH_FLOW = (
+    "cp_auth_flow_change", "auth_flow_change",
+    ("security_review", "platform_owner"),
+)
+_CP_NETWORK_POLICY = (
+    "cp_network_policy_change", "network_policy_change",
+    ("security_review", "network_admin"),
+)
+_CP_EXCEPTION = (
+    "cp_exception_approval", "exception",
+    ("security_review", "platform_owner", "compliance_officer"),
+)
+_CP_REMEDIATION = ("cp_remediation_execution", "remediation_execution", ("security_review",))
+_CHECKPOINTS_BY_LEVEL: dict[str, tuple[tuple[str, str, tuple[str, ...]], ...]] = {
+    "standard": (_CP_DEPLOYMENT_GATE, _CP_AUTH_FLOW),
+    "elevated": (_CP_DEPLOYMENT_GATE, _CP_AUTH_FLOW, _CP_NETWORK_POLICY),
+    "high": (
+        _CP_DEPLOYMENT_GATE, _CP_AUTH_FLOW, _CP_NETWORK_POLICY,
+        _CP_EXCEPTION, _CP_REMEDIATION,
+    ),
+    "strict": (
+        _CP_DEPLOYMENT_GATE, _CP_AUTH_FLOW, _CP_NETWORK_POLICY,
+        _CP_EXCEPTION, _CP_REMEDIATION,
+    ),
+}
+
 
 async def compile_context(
     project_id: str,
@@ -122,12 +173,11 @@ async def compile_context(
     approval_checkpoints = _build_approval_checkpoints(env_profile)
 
     # Build evidence requirements
-    evidence_requirements = ["decision_trace", "test_results", "approval_records", "artifact_versions"]
+    evidence_requirements = _EVIDENCE_REQUIREMENTS
 
     # Build change reassessment triggers
     change_triggers = ChangeReassessmentTriggers(
-        architecture_delta=["new_external_integration", "new_trust_boundary",
-                          "data_classification_change", "auth_flow_change"],
+        architecture_delta=_ARCHITECTURE_DELTA_TRIGGERS,
     )
 
     # Build remediation eligibility
@@ -268,19 +318,23 @@ async def compile_context(
 
     # Compute detached hash: serialize with hash=None (excluded by exclude_none),
     # replace integrity with just compiled_at, then SHA-256 the canonical form.
-    pkg_dict_for_hash = package.model_dump(mode="json", exclude_none=True)
-    pkg_dict_for_hash["package_metadata"]["integrity"] = {
-        "compiled_at": pkg_dict_for_hash["package_metadata"]["integrity"]["compiled_at"]
+    # The same dump is reused for storage below — re-dumping would walk the
+    # whole model tree a second time just to pick up the hash set here.
+    pkg_data = package.model_dump(mode="json", exclude_none=True)
+    integrity_dict = pkg_data["package_metadata"]["integrity"]
+    pkg_data["package_metadata"]["integrity"] = {
+        "compiled_at": integrity_dict["compiled_at"]
     }
-    canonical = json.dumps(pkg_dict_for_hash, sort_keys=True, separators=(",", ":"))
-    package.package_metadata.integrity.hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    canonical = canonical_json(pkg_data)
+    package.package_metadata.integrity.hash = hashlib.sha256(canonical).hexdigest()
 
     # ACoP §4.3: embed integrity_hash as "sha256-{hex}" in the contract object itself
     integrity_hash_value = f"sha256-{package.package_metadata.integrity.hash}"
 
     # Store compiled package
     pkg_repo = CompiledPackageRepository(session)
-    pkg_data = package.model_dump(mode="json", exclude_none=True)
+    integrity_dict["hash"] = package.package_metadata.integrity.hash
+    pkg_data["package_metadata"]["integrity"] = integrity_dict
     pkg_data["integrity_hash"] = integrity_hash_value  # ACoP CIH embedded in contract
     await pkg_repo.create(
         package_id=package_id,
@@ -314,8 +368,8 @@ def _build_prohibited_patterns(defaults: dict) -> list[str]:
     return patterns
 
 
-def _build_approval_required_for(spec: dict) -> list[str]:
-    return ["auth_flow_changes", "network_policy_changes", "data_retention_changes"]
+def _build_approval_required_for(spec: dict) -> tuple[str, ...]:
+    return _APPROVAL_REQUIRED_FOR
 
 
 def _build_rai_requirements(defaults: dict, spec: dict, ai_enabled: bool) -> ResponsibleAiRequirements | None:
@@ -340,7 +394,7 @@ def _build_rai_requirements(defaults: dict, spec: dict, ai_enabled: bool) -> Res
 
 def _build_network_requirements(spec: dict) -> NetworkRequirements:
     return NetworkRequirements(
-        outbound_allowlist=["llm-gateway.internal", "telemetry.internal"],
+        outbound_allowlist=_NETWORK_OUTBOUND_ALLOWLIST,
         public_egress_forbidden=True,
     )
 
@@ -355,69 +409,29 @@ def _build_data_handling(spec: dict) -> DataHandlingRequirements | None:
 
 def _build_tool_constraints(env_profile) -> ToolAndModelConstraints:
     return ToolAndModelConstraints(
-        allowed_tool_classes=["repo_edit", "tests", "static_analysis"],
-        forbidden_tool_classes=["prod_admin"],
+        allowed_tool_classes=_ALLOWED_TOOL_CLASSES,
+        forbidden_tool_classes=_FORBIDDEN_TOOL_CLASSES,
     )
 
 
 def _build_required_tests(defaults: dict, ai_enabled: bool) -> RequiredTests:
-    security = ["authz_negative_tests", "prompt_injection_guardrail_tests", "sensitive_data_leakage_tests"]
-    rai = ["ai_disclosure_presence_test", "explanation_metadata_presence_test"] if ai_enabled else []
-    functional = ["critical-path-smoke-test"]
-    return RequiredTests(security=security, rai=rai, functional=functional)
+    rai = _RAI_TESTS if ai_enabled else ()
+    return RequiredTests(security=_SECURITY_TESTS, rai=rai, functional=_FUNCTIONAL_TESTS)
 
 
 def _build_approval_checkpoints(env_profile) -> list[ApprovalCheckpoint]:
     env = env_profile.environment
     level = env_profile.approval_level or "standard"
 
-    checkpoints = []
-
-    # All levels: deployment gate
-    checkpoints.append(ApprovalCheckpoint(
-        checkpoint_id="cp_deployment_gate",
-        trigger="deployment_gate",
-        required_roles=["platform_owner"],
-        environment=env,
-    ))
-
-    if level in ("standard", "elevated", "high", "strict"):
-        # Standard+: auth flow changes need security review
-        checkpoints.append(ApprovalCheckpoint(
-            checkpoint_id="cp_auth_flow_change",
-            trigger="auth_flow_change",
-            required_roles=["security_review", "platform_owner"],
-            environment=env,
-        ))
-
-    if level in ("elevated", "high", "strict"):
-        # Elevated+: network policy changes need review
-        checkpoints.append(ApprovalCheckpoint(
-            checkpoint_id="cp_network_policy_change",
-            trigger="network_policy_change",
-            required_roles=["security_review", "network_admin"],
-            environment=env,
-        ))
-
-    if level in ("high", "strict"):
-        # High+: exception creation and remediation execution need approval
-        checkpoints.append(ApprovalCheckpoint(
-            checkpoint_id="cp_exception_approval",
-            trigger="exception",
-            required_roles=["security_review", "platform_owner", "compliance_officer"],
+    template = _CHECKPOINTS_BY_LEVEL.get(level, (_CP_DEPLOYMENT_GATE,))
+    # Strict: all deployment roles required, plus exec sign-off
+    strict = level == "strict"
+    return [
+        ApprovalCheckpoint(
+            checkpoint_id=checkpoint_id,
+            trigger=trigger,
+            required_roles=[*roles, "exec_sponsor"] if strict else list(roles),
             environment=env,
-        ))
-        checkpoints.append(ApprovalCheckpoint(
-            checkpoint_id="cp_remediation_execution",
-            trigger="remediation_execution",
-            required_roles=["security_review"],
-            environment=env,
-        ))
-
-    if level == "strict":
-        # Strict: all deployment roles required, plus exec sign-off
-        for cp in checkpoints:
-            if "exec_sponsor" not in (cp.required_roles or []):
-                cp.required_roles = (cp.required_roles or []) + ["exec_sponsor"]
-
-    return checkpoints
+        )
+        for checkpoint_id, trigger, roles in template
+    ]
@@ -3,17 +3,129 @@
 import hashlib
 import json
 from datetime import datetime, timezone
+from typing import Any, Callable
+
+import orjson
 
 from pearl.models.common import Integrity
 
+# Cached so the hot path skips the module attribute lookup per call
+_UTC = timezone.utc
+
+# Node-count cutoff above which hashing streams the canonical form into
+# the digest chunk by chunk instead of materializing one bytes blob.
+_STREAM_NODE_THRESHOLD = 10_000
+
+
+def canonical_json(data: dict) -> bytes:
+    """Serialize data to canonical JSON bytes (sorted keys, compact).
+
+    Compute and verify sites must both use this helper so hashes stay
+    byte-identical. Note: output is raw UTF-8; non-ASCII text is not
+    escaped the way stdlib ``json.dumps`` escapes it.
+    """
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def legacy_canonical_json(data: dict) -> bytes:
+    """Canonical JSON bytes as produced before the switch to orjson.
+
+    Stdlib ``json.dumps`` escapes non-ASCII text to ``\\uXXXX``, so
+    packages compiled before :func:`canonical_json` moved to orjson were
+    hashed over these bytes. Verify sites fall back to this form on a
+    mismatch so the serialization change is never mistaken for tampering.
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def verify_detached_hash(stored_hash: str | None, body: dict) -> tuple[bool, bool]:
+    """Verify a stored detached SHA-256 package hash against ``body``.
+
+    Returns ``(hash_valid, stale_canonicalization)``. A stale match means
+    the package is intact but was hashed before the orjson
+    canonicalization change; a recompile will refresh the hash. Treating
+    such packages as tampered would falsely trigger BA-05 demotion.
+    """
+    if stored_hash is None:
+        return False, False
+    if stored_hash == hashlib.sha256(canonical_json(body)).hexdigest():
+        return True, False
+    if stored_hash == hashlib.sha256(legacy_canonical_json(body)).hexdigest():
+        return True, True
+    return False, False
+
+
+def _remaining_budget(obj: Any, budget: int) -> int:
+    """Decrement ``budget`` per JSON node, stopping as soon as it runs out.
+
+    Early exit keeps the size probe O(threshold) on arbitrarily large
+    packages; a negative return means the threshold was exceeded.
+    """
+    budget -= 1
+    if budget < 0:
+        return budget
+    if isinstance(obj, dict):
+        for value in obj.values():
+            budget = _remaining_budget(value, budget)
+            if budget < 0:
+                break
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            budget = _remaining_budget(value, budget)
+            if budget < 0:
+                break
+    return budget
+
+
+def _canonical_stream(obj: Any, update: Callable[[bytes], Any]) -> None:
+    """Emit the canonical JSON form of ``obj`` as chunks via ``update``.
+
+    Produces the same bytes as :func:`canonical_json` (sorted keys,
+    compact separators) without building the full serialization in
+    memory — peak usage stays at the largest leaf, not the package.
+    """
+    if isinstance(obj, dict):
+        update(b"{")
+        first = True
+        for key in sorted(obj):
+            if first:
+                first = False
+            else:
+                update(b",")
+            update(orjson.dumps(key))
+            update(b":")
+            _canonical_stream(obj[key], update)
+        update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        update(b"[")
+        first = True
+        for value in obj:
+            if first:
+                first = False
+            else:
+                update(b",")
+            _canonical_stream(value, update)
+        update(b"]")
+    else:
+        update(orjson.dumps(obj))
+
 
 def compute_integrity(data: dict) -> Integrity:
-    """Compute SHA-256 hash of canonical JSON representation."""
-    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
-    hash_value = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    """Compute BLAKE2b-128 hash of canonical JSON representation.
+
+    The algorithm travels in ``hash_alg``, so verifiers must honour that
+    field rather than assume SHA-256. Small packages hash one canonical
+    blob; large ones stream chunks into the digest to cap peak memory.
+    """
+    if _remaining_budget(data, _STREAM_NODE_THRESHOLD) < 0:
+        digest = hashlib.blake2b(digest_size=16)
+        _canonical_stream(data, digest.update)
+        hash_value = digest.hexdigest()
+    else:
+        hash_value = hashlib.blake2b(canonical_json(data), digest_size=16).hexdigest()
     return Integrity(
         signed=False,
         hash=hash_value,
-        hash_alg="sha256",
-        compiled_at=datetime.now(timezone.utc),
+        hash_alg="blake2b-128",
+        compiled_at=datetime.now(_UTC),
     )
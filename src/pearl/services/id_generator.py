@@ -1,6 +1,6 @@
 """Prefixed ID generation utility."""
 
-import uuid
+import secrets
 
 
 def generate_id(prefix: str) -> str:
@@ -12,5 +12,4 @@ def generate_id(prefix: str) -> str:
     Returns:
         A string like "proj_a1b2c3d4e5f6".
     """
-    short_uuid = uuid.uuid4().hex[:16]
-    return f"{prefix}{short_uuid}"
+    return f"{prefix}{secrets.token_hex(8)}"
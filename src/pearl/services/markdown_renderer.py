@@ -6,7 +6,77 @@ posture as human-readable markdown for Claude Desktop and dashboards.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+# Static table headers, built once — render functions extend() these in a
+# single C-level call instead of appending line by line per invocation
+_IDENTITY_HEADER = (
+    "## Project Identity",
+    "",
+    "| Field | Value |",
+    "|-------|-------|",
+)
+_SEVERITY_SUMMARY_HEADER = (
+    "## Findings Summary",
+    "",
+    "| Severity | Count |",
+    "|----------|-------|",
+)
+_FINDINGS_HEADER = ("## Findings", "")
+_FINDINGS_TABLE_HEADER = (
+    "| ID | Severity | Category | Title | Status |",
+    "|----|----------|----------|-------|--------|",
+)
+_SECURITY_FINDINGS_HEADER = (
+    "## Security Findings",
+    "",
+    "| Severity | Count |",
+    "|----------|-------|",
+)
+_REQUIREMENTS_HEADER = (
+    "### Requirements",
+    "",
+    "| Requirement | Type | Gate Mode | Status |",
+    "|-------------|------|-----------|--------|",
+)
+_SIGNALS_HEADER = (
+    "### Monitoring Signals",
+    "",
+    "| Signal | Value | Threshold | Status |",
+    "|--------|-------|-----------|--------|",
+)
+
+# Severity keys with display labels, precomputed so the summary loops
+# skip per-call capitalize() and tuple allocation; counts are normalized
+# into a parallel list once per render and zipped against the labels
+_SEV_KEYS = ("critical", "high", "moderate", "low", "informational")
+_SEV_LABELS = ("Critical", "High", "Moderate", "Low", "Informational")
+
+# Sections that make a fairness posture worth rendering at all
+_FAIRNESS_SECTIONS = (
+    "fairness_case",
+    "requirements",
+    "evidence",
+    "monitoring_signals",
+    "exceptions",
+)
+
+# Bound .format methods for table rows — one shared template object per
+# table instead of an f-string rebuilt in the hot loop
+_FINDING_ROW = "| `{}` | {}{} | {} | {} | {} |".format
+_REQUIREMENT_ROW = "| {} | {} | {} | {} |".format
+_SIGNAL_ROW = "| {} | {} | {} | {} |".format
+
+# Status display dispatch — one hash probe instead of chained compares
+_STATUS_ICON = {"passed": "PASS", "failed": "BLOCKED"}
+
+# Single-probe field extractors for fully-populated table rows; rows
+# missing a key fall back to the per-field .get path
+_REQUIREMENT_FIELDS = itemgetter("statement", "type", "gate_mode", "status")
+_SIGNAL_FIELDS = itemgetter("signal_type", "value", "threshold", "within_threshold")
 
 
 def render_project_summary(
@@ -17,133 +87,161 @@ def render_project_summary(
     environment: str | None = None,
 ) -> str:
     """Render a full project governance summary in markdown."""
-    lines: list[str] = []
-    lines.append(f"# {project.get('name', project.get('project_id', 'Unknown'))}")
-    lines.append("")
-
-    # Project identity
-    lines.append("## Project Identity")
-    lines.append("")
-    lines.append(f"| Field | Value |")
-    lines.append(f"|-------|-------|")
-    lines.append(f"| Project ID | `{project.get('project_id', 'N/A')}` |")
-    lines.append(f"| Owner | {project.get('owner_team', 'N/A')} |")
-    lines.append(f"| Criticality | {project.get('business_criticality', 'N/A')} |")
-    lines.append(f"| External Exposure | {project.get('external_exposure', 'N/A')} |")
-    lines.append(f"| AI-Enabled | {'Yes' if project.get('ai_enabled') else 'No'} |")
-    if environment:
-        lines.append(f"| Environment | {environment} |")
-    lines.append("")
+    lines: list[str] = [
+        f"# {project.get('name', project.get('project_id', 'Unknown'))}",
+        "",
+    ]
+
+    # Project identity — memoized; dashboards re-render the same project
+    # with fresh promotion/fairness data far more often than it changes
+    lines.extend(_identity_block(
+        project.get("project_id", "N/A"),
+        project.get("owner_team", "N/A"),
+        project.get("business_criticality", "N/A"),
+        project.get("external_exposure", "N/A"),
+        bool(project.get("ai_enabled")),
+        environment,
+    ))
 
     # Findings summary
     if findings_by_severity:
-        lines.append("## Findings Summary")
-        lines.append("")
-        lines.append("| Severity | Count |")
-        lines.append("|----------|-------|")
-        for sev in ("critical", "high", "moderate", "low", "informational"):
-            count = findings_by_severity.get(sev, 0)
-            if count > 0:
-                lines.append(f"| {sev.capitalize()} | **{count}** |")
-            else:
-                lines.append(f"| {sev.capitalize()} | {count} |")
-        total = sum(findings_by_severity.values())
-        lines.append(f"| **Total** | **{total}** |")
-        lines.append("")
+        lines.extend(_SEVERITY_SUMMARY_HEADER)
+        counts = [findings_by_severity.get(key, 0) for key in _SEV_KEYS]
+        lines.extend(
+            f"| {label} | **{count}** |" if count > 0 else f"| {label} | {count} |"
+            for label, count in zip(_SEV_LABELS, counts)
+        )
+        total = sum(counts)
+        lines.extend((f"| **Total** | **{total}** |", ""))
 
     # Promotion readiness
     if promotion:
-        lines.append(render_promotion_evaluation(promotion))
+        lines.extend(_iter_promotion_evaluation(promotion))
 
     # Fairness posture
     if fairness:
-        lines.append(render_fairness_posture(fairness))
+        lines.extend(_iter_fairness_posture(fairness))
 
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=128)
+def _identity_block(
+    project_id: str,
+    owner: str,
+    criticality: str,
+    exposure: str,
+    ai_enabled: bool,
+    environment: str | None,
+) -> tuple[str, ...]:
+    """Build the project identity table, cached per distinct field set."""
+    rows = [
+        *_IDENTITY_HEADER,
+        f"| Project ID | `{project_id}` |",
+        f"| Owner | {owner} |",
+        f"| Criticality | {criticality} |",
+        f"| External Exposure | {exposure} |",
+        f"| AI-Enabled | {'Yes' if ai_enabled else 'No'} |",
+    ]
+    if environment:
+        rows.append(f"| Environment | {environment} |")
+    rows.append("")
+    return tuple(rows)
+
+
 def render_promotion_evaluation(evaluation: dict) -> str:
     """Render promotion gate evaluation results as markdown."""
-    lines: list[str] = []
+    return "\n".join(_iter_promotion_evaluation(evaluation))
 
-    src = evaluation.get("source_environment", evaluation.get("current_environment", "?"))
-    tgt = evaluation.get("target_environment", evaluation.get("next_environment", "?"))
-    status = evaluation.get("status", "unknown")
-    passed = evaluation.get("passed_count", 0)
-    total = evaluation.get("total_count", 0)
-    pct = evaluation.get("progress_pct", 0)
 
-    status_icon = "PASS" if status == "passed" else "BLOCKED" if status == "failed" else status.upper()
+def _iter_promotion_evaluation(evaluation: dict) -> Iterator[str]:
+    """Yield promotion evaluation markdown line by line.
 
-    lines.append(f"## Promotion Readiness: {src} → {tgt}")
-    lines.append("")
-    lines.append(f"**Status:** {status_icon} — {passed}/{total} rules passing ({pct}%)")
-    lines.append("")
+    Generator form lets composing reports extend their own line buffer
+    directly instead of splicing in a pre-joined blob.
+    """
+    if not evaluation:
+        return
+
+    get = evaluation.get
+    src = get("source_environment") or get("current_environment", "?")
+    tgt = get("target_environment") or get("next_environment", "?")
+    status = get("status", "unknown")
+    passed = get("passed_count", 0)
+    total = get("total_count", 0)
+    pct = get("progress_pct", 0)
+
+    status_icon = _STATUS_ICON.get(status) or status.upper()
+
+    yield f"## Promotion Readiness: {src} → {tgt}"
+    yield ""
+    yield f"**Status:** {status_icon} — {passed}/{total} rules passing ({pct}%)"
+    yield ""
 
     # Rule results table
-    rule_results = evaluation.get("rule_results", [])
+    rule_results = get("rule_results", [])
     if rule_results:
-        passing = [r for r in rule_results if r.get("result") == "passed"]
-        failing = [r for r in rule_results if r.get("result") != "passed"]
+        # Partition in one pass with bound appends instead of two scans
+        passing: list[dict] = []
+        failing: list[dict] = []
+        passing_append, failing_append = passing.append, failing.append
+        for r in rule_results:
+            if r.get("result") == "passed":
+                passing_append(r)
+            else:
+                failing_append(r)
 
         if failing:
-            lines.append("### Blocking")
-            lines.append("")
+            yield "### Blocking"
+            yield ""
             for r in failing:
-                msg = r.get("message", r.get("description", ""))
+                msg = r.get("message") or r.get("description") or ""
                 exc = f" _(exception: `{r['exception_id']}`)_" if r.get("exception_id") else ""
-                lines.append(f"- **{r.get('rule_type', '?')}** — {msg}{exc}")
-            lines.append("")
+                yield f"- **{r.get('rule_type', '?')}** — {msg}{exc}"
+            yield ""
 
         if passing:
-            lines.append("### Passing")
-            lines.append("")
+            yield "### Passing"
+            yield ""
             for r in passing:
-                msg = r.get("message", r.get("description", ""))
-                lines.append(f"- `{r.get('rule_type', '?')}` — {msg}")
-            lines.append("")
+                msg = r.get("message") or r.get("description") or ""
+                yield f"- `{r.get('rule_type', '?')}` — {msg}"
+            yield ""
 
     # Blockers summary
-    blockers = evaluation.get("blockers", [])
+    blockers = get("blockers", [])
     if blockers:
-        lines.append("### Blockers")
-        lines.append("")
-        for b in blockers:
-            lines.append(f"- {b}")
-        lines.append("")
+        yield "### Blockers"
+        yield ""
+        yield from (f"- {b}" for b in blockers)
+        yield ""
 
-    evaluated_at = evaluation.get("evaluated_at") or evaluation.get("last_evaluated_at")
+    evaluated_at = get("evaluated_at") or get("last_evaluated_at")
     if evaluated_at:
-        lines.append(f"_Last evaluated: {evaluated_at}_")
-        lines.append("")
-
-    return "\n".join(lines)
+        yield f"_Last evaluated: {evaluated_at}_"
+        yield ""
 
 
 def render_findings_list(findings: list[dict]) -> str:
     """Render a list of findings as a markdown table."""
-    lines: list[str] = []
-    lines.append("## Findings")
-    lines.append("")
+    lines: list[str] = list(_FINDINGS_HEADER)
 
     if not findings:
-        lines.append("No findings recorded.")
-        lines.append("")
+        lines.extend(("No findings recorded.", ""))
         return "\n".join(lines)
 
-    lines.append("| ID | Severity | Category | Title | Status |")
-    lines.append("|----|----------|----------|-------|--------|")
-
-    for f in findings:
-        fid = f.get("finding_id", "?")
-        sev = f.get("severity", "?")
-        cat = f.get("category", "?")
-        title = f.get("title", "?")
-        status = f.get("status", "open")
-        cvss = f.get("cvss_score")
-        cvss_str = f" (CVSS {cvss})" if cvss is not None else ""
-        lines.append(f"| `{fid}` | {sev}{cvss_str} | {cat} | {title} | {status} |")
-
+    lines.extend(_FINDINGS_TABLE_HEADER)
+    lines.extend(
+        _FINDING_ROW(
+            f.get("finding_id", "?"),
+            f.get("severity", "?"),
+            f" (CVSS {cvss})" if (cvss := f.get("cvss_score")) is not None else "",
+            f.get("category", "?"),
+            f.get("title", "?"),
+            f.get("status", "open"),
+        )
+        for f in findings
+    )
     lines.append("")
     return "\n".join(lines)
 
@@ -157,103 +255,107 @@ def render_release_readiness(
     fairness: dict | None = None,
 ) -> str:
     """Render a release readiness report as markdown."""
-    lines: list[str] = []
-    lines.append(f"# Release Readiness Report: {project_id}")
-    lines.append("")
-    lines.append(f"**Environment:** {environment}")
-    lines.append("")
-
-    # Findings counts
-    total_findings = sum(findings_by_severity.values())
-    critical = findings_by_severity.get("critical", 0)
-    high = findings_by_severity.get("high", 0)
-
-    ready = critical == 0 and high == 0 and len(approval_blockers) == 0
-
-    lines.append(f"**Overall Status:** {'READY' if ready else 'NOT READY'}")
-    lines.append("")
-
-    lines.append("## Security Findings")
-    lines.append("")
-    lines.append("| Severity | Count |")
-    lines.append("|----------|-------|")
-    for sev in ("critical", "high", "moderate", "low", "informational"):
-        count = findings_by_severity.get(sev, 0)
-        lines.append(f"| {sev.capitalize()} | {count} |")
-    lines.append(f"| **Total** | **{total_findings}** |")
-    lines.append("")
+    # Findings counts — normalized once; critical and high lead the tuple
+    counts = [findings_by_severity.get(key, 0) for key in _SEV_KEYS]
+    total_findings = sum(counts)
+
+    ready = counts[0] == 0 and counts[1] == 0 and len(approval_blockers) == 0
+
+    lines: list[str] = [
+        f"# Release Readiness Report: {project_id}",
+        "",
+        f"**Environment:** {environment}",
+        "",
+        f"**Overall Status:** {'READY' if ready else 'NOT READY'}",
+        "",
+    ]
+
+    lines.extend(_SECURITY_FINDINGS_HEADER)
+    lines.extend(
+        f"| {label} | {count} |" for label, count in zip(_SEV_LABELS, counts)
+    )
+    lines.extend((f"| **Total** | **{total_findings}** |", ""))
 
     if approval_blockers:
-        lines.append("## Approval Blockers")
-        lines.append("")
-        for b in approval_blockers:
-            lines.append(f"- {b}")
+        lines.extend(("## Approval Blockers", ""))
+        lines.extend(f"- {b}" for b in approval_blockers)
         lines.append("")
 
     if promotion:
-        lines.append(render_promotion_evaluation(promotion))
+        lines.extend(_iter_promotion_evaluation(promotion))
 
     if fairness:
-        lines.append(render_fairness_posture(fairness))
+        lines.extend(_iter_fairness_posture(fairness))
 
     return "\n".join(lines)
 
 
 def render_fairness_posture(fairness: dict) -> str:
     """Render fairness governance posture as markdown."""
-    lines: list[str] = []
-    lines.append("## Fairness Governance")
-    lines.append("")
+    return "\n".join(_iter_fairness_posture(fairness))
+
+
+def _iter_fairness_posture(fairness: dict) -> Iterator[str]:
+    """Yield fairness posture markdown line by line.
+
+    Yields nothing when no section has content, so bulk dashboards don't
+    pay for an orphaned header per empty posture.
+    """
+    if not any(fairness.get(key) for key in _FAIRNESS_SECTIONS):
+        return
+
+    yield "## Fairness Governance"
+    yield ""
 
     fc = fairness.get("fairness_case")
     if fc:
-        lines.append(f"**Fairness Case:** `{fc.get('fc_id', 'N/A')}`")
-        lines.append(f"- Risk Tier: {fc.get('risk_tier', 'N/A')}")
-        lines.append(f"- Criticality: {fc.get('fairness_criticality', 'N/A')}")
-        lines.append("")
+        yield f"**Fairness Case:** `{fc.get('fc_id', 'N/A')}`"
+        yield f"- Risk Tier: {fc.get('risk_tier', 'N/A')}"
+        yield f"- Criticality: {fc.get('fairness_criticality', 'N/A')}"
+        yield ""
 
     requirements = fairness.get("requirements", [])
     if requirements:
-        lines.append("### Requirements")
-        lines.append("")
-        lines.append("| Requirement | Type | Gate Mode | Status |")
-        lines.append("|-------------|------|-----------|--------|")
+        yield from _REQUIREMENTS_HEADER
         for req in requirements:
-            stmt = req.get("statement", "?")
-            rtype = req.get("type", "?")
-            gmode = req.get("gate_mode", "?")
-            status = req.get("status", "pending")
-            lines.append(f"| {stmt} | {rtype} | {gmode} | {status} |")
-        lines.append("")
+            try:
+                stmt, rtype, gmode, status = _REQUIREMENT_FIELDS(req)
+            except KeyError:
+                stmt = req.get("statement", "?")
+                rtype = req.get("type", "?")
+                gmode = req.get("gate_mode", "?")
+                status = req.get("status", "pending")
+            yield _REQUIREMENT_ROW(stmt, rtype, gmode, status)
+        yield ""
 
     evidence = fairness.get("evidence")
     if evidence:
         att_status = evidence.get("attestation_status", "unsigned")
-        lines.append(f"### Evidence")
-        lines.append(f"- Evidence ID: `{evidence.get('evidence_id', 'N/A')}`")
-        lines.append(f"- Attestation: **{att_status}**")
-        lines.append("")
+        yield "### Evidence"
+        yield f"- Evidence ID: `{evidence.get('evidence_id', 'N/A')}`"
+        yield f"- Attestation: **{att_status}**"
+        yield ""
 
     signals = fairness.get("monitoring_signals", [])
     if signals:
-        lines.append("### Monitoring Signals")
-        lines.append("")
-        lines.append("| Signal | Value | Threshold | Status |")
-        lines.append("|--------|-------|-----------|--------|")
+        yield from _SIGNALS_HEADER
         for s in signals:
-            stype = s.get("signal_type", "?")
-            val = s.get("value", "?")
-            thresh = s.get("threshold", "N/A")
-            ok = "OK" if s.get("within_threshold", True) else "ALERT"
-            lines.append(f"| {stype} | {val} | {thresh} | {ok} |")
-        lines.append("")
+            try:
+                stype, val, thresh, within = _SIGNAL_FIELDS(s)
+            except KeyError:
+                stype = s.get("signal_type", "?")
+                val = s.get("value", "?")
+                thresh = s.get("threshold", "N/A")
+                within = s.get("within_threshold", True)
+            yield _SIGNAL_ROW(stype, val, thresh, "OK" if within else "ALERT")
+        yield ""
 
     exceptions = fairness.get("exceptions", [])
     if exceptions:
-        lines.append("### Active Exceptions")
-        lines.append("")
-        for exc in exceptions:
-            lines.append(f"- `{exc.get('exception_id', '?')}` — {exc.get('reason', 'N/A')} (status: {exc.get('status', '?')})")
-        lines.append("")
-
-    return "\n".join(lines)
+        yield "### Active Exceptions"
+        yield ""
+        yield from (
+            f"- `{exc.get('exception_id', '?')}` — {exc.get('reason', 'N/A')} (status: {exc.get('status', '?')})"
+            for exc in exceptions
+        )
+        yield ""
@@ -1,12 +1,19 @@
 """Default promotion gate definitions for the 4 environment transitions."""
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 from pearl.models.enums import GateRuleType
 
+# Interned rule IDs, one per enum member, shared by every gate definition
+_RULE_IDS = {rt: sys.intern(f"rule_{rt}") for rt in GateRuleType}
 
-def _rule(rule_type: str, description: str, ai_only: bool = False, threshold: float | None = None, **kwargs):
-    """Helper to build a gate rule definition dict."""
+
+@lru_cache(maxsize=None)
+def _cached_rule(rule_type: str, description: str, ai_only: bool, threshold: float | None):
     r = {
-        "rule_id": f"rule_{rule_type}",
+        "rule_id": _RULE_IDS.get(rule_type) or f"rule_{rule_type}",
         "rule_type": rule_type,
         "description": description,
         "required": True,
@@ -14,19 +21,39 @@ def _rule(rule_type: str, description: str, ai_only: bool = False, threshold: fl
     }
     if threshold is not None:
         r["threshold"] = threshold
+    return r
+
+
+def _rule(rule_type: str, description: str, ai_only: bool = False, threshold: float | None = None, **kwargs):
+    """Helper to build a gate rule definition dict.
+
+    Identical definitions share a single cached dict, so rules repeated
+    across gates are allocated once at import. Callers must treat the
+    returned dict as read-only.
+    """
     if kwargs:
+        r = dict(_cached_rule(rule_type, description, ai_only, threshold))
         r["parameters"] = kwargs
-    return r
+        return r
+    return _cached_rule(rule_type, description, ai_only, threshold)
 
 
+# Pipeline stages in promotion order — the single source of truth for the
+# chain; gate transitions reference these keys so the two cannot drift
+_STAGES = (
+    MappingProxyType({"key": "pilot", "label": "Pilot", "description": "Non-guardrailed experimental environment", "order": 0}),
+    MappingProxyType({"key": "dev", "label": "Dev", "description": "Active development environment", "order": 1}),
+    MappingProxyType({"key": "prod", "label": "Prod", "description": "Live production environment", "order": 2}),
+)
+
 # ─── pilot → dev ──────────────────────────────────────────────
 # Experimental → active development. Governance, baseline, and AI scan checks.
 
-PILOT_TO_DEV = {
+PILOT_TO_DEV = MappingProxyType({
     "gate_id": "gate_5730ef26ca8c46e9",
-    "source_environment": "pilot",
-    "target_environment": "dev",
-    "rules": [
+    "source_environment": _STAGES[0]["key"],
+    "target_environment": _STAGES[1]["key"],
+    "rules": (
         _rule(GateRuleType.PROJECT_REGISTERED, "Project must be registered in PeaRL"),
         _rule(GateRuleType.ORG_BASELINE_ATTACHED, "Organization security baseline must be attached"),
         _rule(GateRuleType.APP_SPEC_DEFINED, "Application specification must be defined"),
@@ -36,17 +63,17 @@ PILOT_TO_DEV = {
         _rule(GateRuleType.FAIRNESS_CASE_DEFINED, "Fairness case must be defined", ai_only=True),
         _rule(GateRuleType.MODEL_CARD_DOCUMENTED, "Model card must be documented", ai_only=True),
         _rule(GateRuleType.AIUC_COMPLIANCE_SCORE, "AIUC-1 responsible AI compliance — all mandatory controls satisfied", ai_only=True),
-    ],
-}
+    ),
+})
 
 # ─── dev → prod ────────────────────────────────────────────────
 # Full governance gate before production. Human approval required.
 
-DEV_TO_PROD = {
+DEV_TO_PROD = MappingProxyType({
     "gate_id": "gate_ce6c49cb2a3d48bf",
-    "source_environment": "dev",
-    "target_environment": "prod",
-    "rules": [
+    "source_environment": _STAGES[1]["key"],
+    "target_environment": _STAGES[2]["key"],
+    "rules": (
         _rule(GateRuleType.PROJECT_REGISTERED, "Project must be registered in PeaRL"),
         _rule(GateRuleType.ORG_BASELINE_ATTACHED, "Org baseline must be attached"),
         _rule(GateRuleType.APP_SPEC_DEFINED, "App spec must be defined"),
@@ -72,24 +99,21 @@ DEV_TO_PROD = {
         _rule(GateRuleType.FACTORY_RUN_SUMMARY_PRESENT, "Factory run summary present with no anomaly flags", ai_only=True),
         _rule(GateRuleType.SONARQUBE_QUALITY_GATE, "SonarQube quality gate must pass (OK)"),
         _rule(GateRuleType.SNYK_OPEN_HIGH_CRITICAL, "Snyk SCA: no open HIGH/CRITICAL vulnerabilities"),
-    ],
-}
+    ),
+})
 
 
-DEFAULT_GATES = [PILOT_TO_DEV, DEV_TO_PROD]
+# Read-only registry: proxied gate dicts with tuple rule lists
+DEFAULT_GATES = (PILOT_TO_DEV, DEV_TO_PROD)
 
 # Default promotion pipeline: pilot → dev → prod
-DEFAULT_PIPELINE = {
+DEFAULT_PIPELINE = MappingProxyType({
     "pipeline_id": "pipe_default",
     "name": "Default Chain",
     "description": "Standard 3-stage promotion chain: pilot → dev → prod",
     "is_default": True,
-    "stages": [
-        {"key": "pilot", "label": "Pilot", "description": "Non-guardrailed experimental environment", "order": 0},
-        {"key": "dev", "label": "Dev", "description": "Active development environment", "order": 1},
-        {"key": "prod", "label": "Prod", "description": "Live production environment", "order": 2},
-    ],
-}
+    "stages": _STAGES,
+})
 
 
 async def seed_default_gates(session) -> int:
@@ -103,22 +127,27 @@ async def seed_default_gates(session) -> int:
     gate_repo = PromotionGateRepository(session)
     created = 0
 
-    # Remove legacy gates that no longer match the pipeline
+    # One IN query covers the legacy cleanup and the existence checks
     _legacy_gate_ids = ["gate_sandbox_to_dev", "gate_dev_to_preprod", "gate_preprod_to_prod"]
+    known = await gate_repo.get_many(
+        _legacy_gate_ids + [g["gate_id"] for g in DEFAULT_GATES]
+    )
+
+    # Remove legacy gates that no longer match the pipeline
     for legacy_id in _legacy_gate_ids:
-        legacy = await gate_repo.get(legacy_id)
+        legacy = known.get(legacy_id)
         if legacy:
             await session.delete(legacy)
 
     for gate_def in DEFAULT_GATES:
-        existing = await gate_repo.get(gate_def["gate_id"])
+        existing = known.get(gate_def["gate_id"])
         if not existing:
             await gate_repo.create(
                 gate_id=gate_def["gate_id"],
                 source_environment=gate_def["source_environment"],
                 target_environment=gate_def["target_environment"],
                 project_id=None,
-                rules=gate_def["rules"],
+                rules=list(gate_def["rules"]),
             )
             created += 1
         else:
@@ -138,7 +167,7 @@ async def seed_default_gates(session) -> int:
             name=DEFAULT_PIPELINE["name"],
             description=DEFAULT_PIPELINE["description"],
             is_default=current_default is None,  # only default if nothing else is
-            stages=DEFAULT_PIPELINE["stages"],
+            stages=[dict(stage) for stage in DEFAULT_PIPELINE["stages"]],
             project_id=None,
         )
 
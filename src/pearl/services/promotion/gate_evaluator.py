@@ -1,7 +1,10 @@
 """Gate evaluation engine — checks project readiness for environment promotion."""
 
+import time
 from datetime import datetime, timezone
+from weakref import WeakKeyDictionary
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -40,17 +43,52 @@ from pearl.repositories.promotion_repo import (
     PromotionGateRepository,
 )
 from pearl.repositories.report_repo import ReportRepository
+from pearl.scanning.compliance.assessor import ComplianceAssessor
+from pearl.scanning.types import AttackCategory, ScanSeverity
 from pearl.services.id_generator import generate_id
 from pearl.services.promotion.requirement_resolver import ResolvedRequirement, resolve_requirements
 
+# One compiled serializer for the whole result list — avoids per-instance
+# model_dump dispatch when persisting 30-60 rule results per evaluation
+_RULE_RESULTS_ADAPTER: TypeAdapter[list[RuleEvaluationResult]] = TypeAdapter(
+    list[RuleEvaluationResult]
+)
+
+# Enum members keyed by value — replaces try/except ValueError coercion
+# in the per-finding compliance loop with a single dict probe
+_ATTACK_CATEGORIES = {m.value: m for m in AttackCategory}
+_SCAN_SEVERITIES = {m.value: m for m in ScanSeverity}
+
+# assess() is stateless over self (it only reads the default framework
+# list), so one shared instance serves every evaluation
+_COMPLIANCE_ASSESSOR = ComplianceAssessor()
+
+
+# Default-pipeline stage keys cached per engine with a short TTL —
+# next_environment runs on every evaluation but pipelines change rarely.
+# Keyed by the session's bind so separate databases never share entries.
+_PIPELINE_KEYS_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+_PIPELINE_KEYS_TTL = 30.0
+
+
+def invalidate_pipeline_cache() -> None:
+    """Drop cached pipeline stage keys — call after mutating pipelines."""
+    _PIPELINE_KEYS_CACHE.clear()
+
 
 async def next_environment(current: str, session: AsyncSession) -> str | None:
     """Get the next environment in the promotion chain from the default pipeline."""
-    pipeline = await PromotionPipelineRepository(session).get_default()
-    if not pipeline:
-        return None
-    stages = sorted(pipeline.stages, key=lambda s: s["order"])
-    keys = [s["key"] for s in stages]
+    bind = session.get_bind()
+    cached = _PIPELINE_KEYS_CACHE.get(bind)
+    if cached is not None and time.monotonic() - cached[0] < _PIPELINE_KEYS_TTL:
+        keys = cached[1]
+    else:
+        pipeline = await PromotionPipelineRepository(session).get_default()
+        if not pipeline:
+            return None
+        stages = sorted(pipeline.stages, key=lambda s: s["order"])
+        keys = [s["key"] for s in stages]
+        _PIPELINE_KEYS_CACHE[bind] = (time.monotonic(), keys)
     try:
         idx = keys.index(current)
         return keys[idx + 1] if idx < len(keys) - 1 else None
@@ -64,6 +102,7 @@ async def evaluate_promotion(
     trace_id: str | None = None,
     session: AsyncSession | None = None,
     source_environment: str | None = None,
+    fast_fail: bool = False,
 ) -> PromotionEvaluation:
     """Evaluate project readiness for promotion to the next environment.
 
@@ -73,6 +112,10 @@ async def evaluate_promotion(
     4. Evaluate each rule
     5. Persist evaluation
     6. Return result
+
+    With fast_fail=True, evaluation stops at the first failing required
+    rule and the remaining rules are recorded as skipped — useful for
+    cheap pre-checks where only the pass/fail verdict matters.
     """
     # Load project
     project_repo = ProjectRepository(session)
@@ -110,7 +153,7 @@ async def evaluate_promotion(
 
     # Evaluate each rule (static gate rules + dynamically derived BU requirements)
     rule_results = []
-    static_rules = _parse_rules(gate.rules)
+    static_rules = _parsed_gate_rules(gate)
 
     # Inject FRAMEWORK_CONTROL_REQUIRED rules from BU requirements not already in gate
     existing_control_ids = {
@@ -138,9 +181,24 @@ async def evaluate_promotion(
             dynamic_rules.append(dyn_rule)
             existing_control_ids.add(req.control_id)
 
-    for rule_def in static_rules + dynamic_rules:
+    all_rules = static_rules + dynamic_rules
+    for position, rule_def in enumerate(all_rules):
         result = _evaluate_rule(rule_def, ctx)
         rule_results.append(result)
+        if fast_fail and result.result == GateRuleResult.FAIL and rule_def.required:
+            rule_results.extend(
+                RuleEvaluationResult(
+                    rule_id=r.rule_id,
+                    rule_type=r.rule_type,
+                    result=GateRuleResult.SKIP,
+                    message=(
+                        f"Skipped: {r.description} (not evaluated — "
+                        f"required rule '{rule_def.rule_type}' failed in fast-fail mode)"
+                    ),
+                )
+                for r in all_rules[position + 1:]
+            )
+            break
 
     # Calculate summary
     passed = sum(1 for r in rule_results if r.result == GateRuleResult.PASS)
@@ -185,7 +243,7 @@ async def evaluate_promotion(
         source_environment=current_env,
         target_environment=target_environment,
         status=status.value,
-        rule_results=[r.model_dump(mode="json") for r in rule_results],
+        rule_results=_RULE_RESULTS_ADAPTER.dump_python(rule_results, mode="json"),
         passed_count=passed,
         failed_count=failed,
         skipped_count=skipped,
@@ -272,6 +330,10 @@ class _EvalContext:
         self.has_approval = {}
         self.active_exceptions = []
         self.rejected_exceptions = []
+        # Exceptions indexed by the control/rule-type they cover, so the
+        # per-rule coverage check is a dict probe instead of a linear scan
+        self.exceptions_by_control: dict[str, list] = {}
+        self.rejected_by_control: dict[str, list] = {}
         self.has_report = {}
         # Fairness context
         self.has_fairness_case = False
@@ -289,6 +351,15 @@ class _EvalContext:
         self.mass_scan_targets = []
         self.has_mass_scan_target = False
         self.mass_scan_completed = False
+        # Keyword/category buckets over open findings, filled once during
+        # the context build so evaluators don't rescan the full list each
+        self.secret_findings = []
+        self.prompt_injection_findings = []
+        self.guardrail_findings = []
+        self.guardrail_coverage_findings = []
+        self.pii_findings = []
+        self.owasp_llm_findings = []
+        self.fairness_hard_blocks = []
         # Scanning integration context
         self.completed_analyzers: list[str] = []
         self.pearl_scan_findings: list = []
@@ -315,6 +386,7 @@ class _EvalContext:
         self.mass_verdict_risk_level: str | None = None  # "low"|"medium"|"high"|"critical"
         # LiteLLM compliance context
         self.litellm_scan_seen: bool = False
+        self.open_litellm_findings = []
         # Factory run summary context
         self.has_factory_run_summary: bool = False
         self.factory_run_anomaly_count: int = 0
@@ -361,21 +433,74 @@ async def _build_eval_context(
     pkg = await pkg_repo.get_latest_by_project(project_id)
     ctx.has_compiled_package = pkg is not None
 
-    # Load findings (open only)
-    stmt = select(FindingRow).where(
-        FindingRow.project_id == project_id,
-        FindingRow.status == "open",
+    # Load ALL findings for this project in one query (all statuses — the
+    # security review and analyzer gates need resolved findings too). The
+    # open subset, per-severity/category/source buckets, and the per-tool
+    # integration context are all derived in a single pass.
+    # Streamed with a server-side cursor so large projects never buffer
+    # the full result set twice (driver + ORM list) before bucketing.
+    stmt = (
+        select(FindingRow)
+        .where(FindingRow.project_id == project_id)
+        .execution_options(yield_per=500)
     )
-    result = await session.execute(stmt)
-    all_findings = list(result.scalars().all())
-    ctx.open_findings = all_findings
+    findings_stream = await session.stream_scalars(stmt)
+
+    all_pearl_scan: list = []
+    analyzer_names_seen: set[str] = set()
+    snyk_findings: list = []
+    mass_marker = None
+    mass_marker_external_id = f"mass-marker-{project_id}"
+
+    async for f in findings_stream:
+        source = f.source or {}
+        tool_name = source.get("tool_name", "")
+        if f.status == "open":
+            ctx.open_findings.append(f)
+            ctx.findings_by_severity.setdefault(f.severity, []).append(f)
+            ctx.findings_by_category.setdefault(f.category, []).append(f)
+            ctx.findings_by_source.setdefault(source.get("tool_type", "unknown"), []).append(f)
+            # Scanning integration: open pearl_scan findings feed compliance scoring
+            if tool_name.startswith("pearl_scan"):
+                ctx.pearl_scan_findings.append(f)
+            # Keyword/category buckets — lower the title once per finding
+            # instead of once per rule inside each evaluator
+            title_lower = (f.title or "").lower()
+            category = f.category or ""
+            if "secret" in title_lower or "hardcoded" in title_lower:
+                ctx.secret_findings.append(f)
+            if "prompt_injection" in category or "prompt_injection" in title_lower:
+                ctx.prompt_injection_findings.append(f)
+            if "guardrail" in category or "guardrail" in title_lower:
+                ctx.guardrail_findings.append(f)
+            if any(kw in title_lower for kw in ("guardrail", "input_validation", "output_filtering", "rate_limit")):
+                ctx.guardrail_coverage_findings.append(f)
+            if "pii" in title_lower or "data_leakage" in category:
+                ctx.pii_findings.append(f)
+            if (f.compliance_refs or {}).get("owasp_llm_top10"):
+                ctx.owasp_llm_findings.append(f)
+            if tool_name == "litellm":
+                ctx.open_litellm_findings.append(f)
+            if category == "responsible_ai" and f.severity == "critical":
+                ctx.fairness_hard_blocks.append(f)
+        if tool_name.startswith("pearl_scan"):
+            all_pearl_scan.append(f)
+            # Determine which analyzers have completed from ALL pearl_scan findings
+            if tool_name.startswith("pearl_scan_"):
+                analyzer_names_seen.add(tool_name.replace("pearl_scan_", ""))
+        elif tool_name == "claude_security_review":
+            # Security review findings — all statuses so resolved reviews count
+            ctx.security_review_findings.append(f)
+        elif tool_name == "snyk_sca":
+            snyk_findings.append(f)
+        elif tool_name == "litellm":
+            # LiteLLM compliance context
+            ctx.litellm_scan_seen = True
+        # MASS 2.0 marker — identified by source.external_id
+        if mass_marker is None and source.get("external_id") == mass_marker_external_id:
+            mass_marker = f
 
-    for f in all_findings:
-        sev = f.severity
-        ctx.findings_by_severity.setdefault(sev, []).append(f)
-        ctx.findings_by_category.setdefault(f.category, []).append(f)
-        source = (f.source or {}).get("tool_type", "unknown")
-        ctx.findings_by_source.setdefault(source, []).append(f)
+    ctx.completed_analyzers = list(analyzer_names_seen)
 
     # Load approvals
     approval_repo = ApprovalRequestRepository(session)
@@ -388,6 +513,13 @@ async def _build_eval_context(
     exc_repo = ExceptionRepository(session)
     ctx.active_exceptions = await exc_repo.get_active_by_project(project_id)
     ctx.rejected_exceptions = await exc_repo.get_rejected_by_project(project_id)
+    for exc_list, index in (
+        (ctx.active_exceptions, ctx.exceptions_by_control),
+        (ctx.rejected_exceptions, ctx.rejected_by_control),
+    ):
+        for e in exc_list:
+            for control in (getattr(e, "scope", None) or {}).get("controls") or []:
+                index.setdefault(control, []).append(e)
 
     # Load reports
     report_repo = ReportRepository(session)
@@ -437,9 +569,9 @@ async def _build_eval_context(
     result2 = await session.execute(stmt2)
     ctx.monitoring_signals = list(result2.scalars().all())
 
+    # Only the boolean is needed — EXISTS avoids loading receipt rows
     cr_repo = ContextReceiptRepository(session)
-    receipts = await cr_repo.list_by_field("project_id", project_id)
-    ctx.has_context_receipt = len(receipts) > 0
+    ctx.has_context_receipt = await cr_repo.exists_for_project(project_id)
 
     # Load scan targets
     from pearl.repositories.scan_target_repo import ScanTargetRepository
@@ -452,38 +584,6 @@ async def _build_eval_context(
         st.last_scan_status == "succeeded" for st in ctx.mass_scan_targets
     )
 
-    # Scanning integration: pearl_scan findings (open only — for compliance scoring)
-    ctx.pearl_scan_findings = [
-        f for f in all_findings
-        if (f.source or {}).get("tool_name", "").startswith("pearl_scan")
-    ]
-
-    # Load ALL findings for this project (all statuses) — needed for analyzer tracking
-    # and security review gate (which checks resolved findings, not just open ones).
-    all_scan_stmt = select(FindingRow).where(
-        FindingRow.project_id == project_id,
-    )
-    all_scan_result = await session.execute(all_scan_stmt)
-    all_project_findings = list(all_scan_result.scalars().all())
-    all_pearl_scan = [
-        f for f in all_project_findings
-        if (f.source or {}).get("tool_name", "").startswith("pearl_scan")
-    ]
-
-    # Security review findings — must use all statuses so resolved reviews count
-    ctx.security_review_findings = [
-        f for f in all_project_findings
-        if (f.source or {}).get("tool_name") == "claude_security_review"
-    ]
-
-    # Determine which analyzers have completed from ALL pearl_scan findings
-    analyzer_names_seen: set[str] = set()
-    for f in all_pearl_scan:
-        tool_name = (f.source or {}).get("tool_name", "")
-        if tool_name.startswith("pearl_scan_"):
-            analyzer_names_seen.add(tool_name.replace("pearl_scan_", ""))
-    ctx.completed_analyzers = list(analyzer_names_seen)
-
     # Also count pearl_scan findings as MASS scan completed
     if all_pearl_scan and not ctx.mass_scan_completed:
         ctx.mass_scan_completed = True
@@ -491,26 +591,18 @@ async def _build_eval_context(
     # Run compliance assessment if pearl_scan findings exist
     if ctx.pearl_scan_findings:
         try:
-            from pearl.scanning.compliance.assessor import ComplianceAssessor
-            from pearl.scanning.types import AttackCategory, ScanSeverity
-
             finding_dicts = []
             for f in ctx.pearl_scan_findings:
                 full = f.full_data or {}
                 cat_str = full.get("category", f.category)
                 sev_str = full.get("severity", f.severity)
-                try:
-                    cat = AttackCategory(cat_str)
-                except (ValueError, KeyError):
-                    cat = cat_str
-                try:
-                    sev = ScanSeverity(sev_str)
-                except (ValueError, KeyError):
-                    sev = sev_str
-                finding_dicts.append({"category": cat, "severity": sev, "id": f.finding_id})
-
-            assessor = ComplianceAssessor()
-            ctx.compliance_assessment = assessor.assess(finding_dicts)
+                finding_dicts.append({
+                    "category": _ATTACK_CATEGORIES.get(cat_str, cat_str),
+                    "severity": _SCAN_SEVERITIES.get(sev_str, sev_str),
+                    "id": f.finding_id,
+                })
+
+            ctx.compliance_assessment = _COMPLIANCE_ASSESSOR.assess(finding_dicts)
             ctx.compliance_score = ctx.compliance_assessment.overall_compliance_score
         except Exception:
             pass
@@ -527,18 +619,13 @@ async def _build_eval_context(
         except Exception:
             ctx.bu_requirements = []
 
-    # Snyk SCA context — derived from all_project_findings (already loaded above)
-    snyk_findings = [f for f in all_project_findings if (f.source or {}).get("tool_name") == "snyk_sca"]
+    # Snyk SCA context — derived from the single findings pass above
     ctx.snyk_scan_seen = len(snyk_findings) > 0
     open_snyk = [f for f in snyk_findings if f.status == "open"]
     ctx.snyk_open_critical = sum(1 for f in open_snyk if f.severity == "critical")
     ctx.snyk_open_high = sum(1 for f in open_snyk if f.severity == "high")
 
-    # MASS 2.0 marker — identified by source.external_id == f"mass-marker-{project_id}"
-    mass_marker = next(
-        (f for f in all_project_findings if (f.source or {}).get("external_id") == f"mass-marker-{project_id}"),
-        None,
-    )
+    # MASS 2.0 marker — located during the single findings pass above
     ctx.mass_scan_seen = mass_marker is not None
     if mass_marker:
         ctx.mass_risk_score = float((mass_marker.full_data or {}).get("risk_score", 0.0))
@@ -593,11 +680,6 @@ async def _build_eval_context(
         elif snyk_f.severity == "high":
             ctx.snyk_open_high += 1
 
-    # LiteLLM compliance context
-    ctx.litellm_scan_seen = any(
-        (f.source or {}).get("tool_name") == "litellm" for f in all_project_findings
-    )
-
     # Factory run summary context
     try:
         from pearl.db.models.factory_run_summary import FactoryRunSummaryRow
@@ -759,6 +841,25 @@ def _parse_rules(rules_data) -> list[GateRuleDefinition]:
     return []
 
 
+# Parsed rules memoized per gate revision — gates change rarely, while
+# every evaluation re-validated 30-60 rule dicts through Pydantic.
+# updated_at rolls on any gate edit, so stale entries can never be served.
+_PARSED_RULES_CACHE: dict[tuple[str, datetime | None], tuple[GateRuleDefinition, ...]] = {}
+_PARSED_RULES_CACHE_MAX = 256
+
+
+def _parsed_gate_rules(gate) -> list[GateRuleDefinition]:
+    """Return parsed rule definitions for a gate, cached by (gate_id, updated_at)."""
+    key = (gate.gate_id, getattr(gate, "updated_at", None))
+    cached = _PARSED_RULES_CACHE.get(key)
+    if cached is None:
+        if len(_PARSED_RULES_CACHE) >= _PARSED_RULES_CACHE_MAX:
+            _PARSED_RULES_CACHE.clear()
+        cached = tuple(_parse_rules(gate.rules))
+        _PARSED_RULES_CACHE[key] = cached
+    return list(cached)
+
+
 def _evaluate_rule(rule: GateRuleDefinition, ctx: _EvalContext) -> RuleEvaluationResult:
     """Evaluate a single gate rule against the context."""
     # Skip AI-only rules if project is not AI-enabled
@@ -783,13 +884,8 @@ def _evaluate_rule(rule: GateRuleDefinition, ctx: _EvalContext) -> RuleEvaluatio
         passed, message, details = evaluator(rule, ctx)
         if not passed:
             # Check if an active exception covers this rule
-            covering = next(
-                (
-                    e for e in ctx.active_exceptions
-                    if rule.rule_type in ((getattr(e, "scope", None) or {}).get("controls") or [])
-                ),
-                None,
-            )
+            covering_list = ctx.exceptions_by_control.get(rule.rule_type)
+            covering = covering_list[0] if covering_list else None
             if covering:
                 return RuleEvaluationResult(
                     rule_id=rule.rule_id,
@@ -799,13 +895,8 @@ def _evaluate_rule(rule: GateRuleDefinition, ctx: _EvalContext) -> RuleEvaluatio
                     exception_id=covering.exception_id,
                 )
             # Check if a prior exception for this rule was rejected
-            rejected = next(
-                (
-                    e for e in ctx.rejected_exceptions
-                    if rule.rule_type in ((getattr(e, "scope", None) or {}).get("controls") or [])
-                ),
-                None,
-            )
+            rejected_list = ctx.rejected_by_control.get(rule.rule_type)
+            rejected = rejected_list[0] if rejected_list else None
             if rejected:
                 return RuleEvaluationResult(
                     rule_id=rule.rule_id,
@@ -863,7 +954,7 @@ def _eval_app_spec_defined(rule, ctx):
 
 
 def _eval_no_hardcoded_secrets(rule, ctx):
-    secret_findings = [f for f in ctx.open_findings if "secret" in (f.title or "").lower() or "hardcoded" in (f.title or "").lower()]
+    secret_findings = ctx.secret_findings
     passed = len(secret_findings) == 0
     return passed, f"No hardcoded secrets" if passed else f"{len(secret_findings)} hardcoded secret finding(s)", None
 
@@ -1009,25 +1100,25 @@ def _eval_scan_target_registered(rule, ctx):
 
 
 def _eval_no_prompt_injection(rule, ctx):
-    pi_findings = [f for f in ctx.open_findings if "prompt_injection" in (f.category or "") or "prompt_injection" in (f.title or "").lower()]
+    pi_findings = ctx.prompt_injection_findings
     passed = len(pi_findings) == 0
     return passed, "0 prompt injection findings" if passed else f"{len(pi_findings)} prompt injection finding(s)", {"count": len(pi_findings)}
 
 
 def _eval_guardrails_verified(rule, ctx):
-    guardrail_findings = [f for f in ctx.open_findings if "guardrail" in (f.category or "") or "guardrail" in (f.title or "").lower()]
+    guardrail_findings = ctx.guardrail_findings
     passed = len(guardrail_findings) == 0
     return passed, "Guardrails verified (0 findings)" if passed else f"{len(guardrail_findings)} guardrail finding(s)", None
 
 
 def _eval_no_pii_leakage(rule, ctx):
-    pii_findings = [f for f in ctx.open_findings if "pii" in (f.title or "").lower() or "data_leakage" in (f.category or "")]
+    pii_findings = ctx.pii_findings
     passed = len(pii_findings) == 0
     return passed, "0 PII leakage findings" if passed else f"{len(pii_findings)} PII leakage finding(s)", None
 
 
 def _eval_owasp_llm_top10_clear(rule, ctx):
-    owasp_findings = [f for f in ctx.open_findings if (f.compliance_refs or {}).get("owasp_llm_top10")]
+    owasp_findings = ctx.owasp_llm_findings
     passed = len(owasp_findings) == 0
     return passed, "OWASP LLM Top 10 clear" if passed else f"{len(owasp_findings)} OWASP LLM Top 10 finding(s)", None
 
@@ -1051,11 +1142,13 @@ def _eval_ai_risk_acceptable(rule, ctx):
         return False, f"MASS 2.0 risk score {ctx.mass_risk_score:.1f} exceeds threshold {threshold}", {"risk_score": ctx.mass_risk_score, "threshold": threshold}
     if not ctx.mass_scan_seen and not ctx.mass_scan_completed:
         return False, "No MASS 2.0 scan ingested — POST to /integrations/mass/ingest", None
-    # Fallback: check findings from any AI scan source
+    # Fallback: check findings from any AI scan source — the by-source
+    # buckets avoid re-reading f.source per finding
     high_risk = [
-        f for f in ctx.open_findings
+        f
+        for tool_type in _AI_SCAN_TOOL_TYPES
+        for f in ctx.findings_by_source.get(tool_type, ())
         if (f.cvss_score or 0) >= threshold
-        and (f.source or {}).get("tool_type") in _AI_SCAN_TOOL_TYPES
     ]
     passed = len(high_risk) == 0
     return passed, f"AI scan risk below threshold ({threshold})" if passed else f"{len(high_risk)} finding(s) above risk threshold", None
@@ -1068,8 +1161,10 @@ _eval_mass_risk_acceptable = _eval_ai_risk_acceptable
 def _eval_comprehensive_ai_scan(rule, ctx):
     # Comprehensive: AI scan findings with verdict data present, or scan completed
     ai_with_verdict = [
-        f for f in ctx.open_findings
-        if f.verdict and (f.source or {}).get("tool_type") in _AI_SCAN_TOOL_TYPES
+        f
+        for tool_type in _AI_SCAN_TOOL_TYPES
+        for f in ctx.findings_by_source.get(tool_type, ())
+        if f.verdict
     ]
     passed = len(ai_with_verdict) > 0 or _eval_ai_scan_completed(rule, ctx)[0]
     return passed, "Comprehensive AI security scan with verdicts" if passed else "No comprehensive AI security scan", None
@@ -1136,7 +1231,7 @@ def _eval_fairness_attestation_signed(rule, ctx):
 
 def _eval_fairness_hard_blocks_clear(rule, ctx):
     # No hard blocks = no failed critical fairness findings
-    hard_blocks = [f for f in ctx.open_findings if f.category == "responsible_ai" and f.severity == "critical"]
+    hard_blocks = ctx.fairness_hard_blocks
     passed = len(hard_blocks) == 0
     return passed, "No fairness hard blocks" if passed else f"{len(hard_blocks)} fairness hard block(s)", None
 
@@ -1192,10 +1287,7 @@ def _eval_required_analyzers_completed(rule, ctx):
 def _eval_guardrail_coverage(rule, ctx):
     # Check that guardrail-related findings have been addressed
     # or that recommended guardrails have implementation evidence
-    guardrail_issues = [
-        f for f in ctx.open_findings
-        if any(kw in (f.title or "").lower() for kw in ("guardrail", "input_validation", "output_filtering", "rate_limit"))
-    ]
+    guardrail_issues = ctx.guardrail_coverage_findings
     passed = len(guardrail_issues) == 0
     return passed, "Guardrail coverage adequate (0 open guardrail findings)" if passed else f"{len(guardrail_issues)} open guardrail-related finding(s)", None
 
@@ -1262,10 +1354,7 @@ def _eval_litellm_compliance(rule, ctx):
             "No LiteLLM compliance scan ingested — configure LiteLLM integration and pull findings first",
             None,
         )
-    open_litellm = [
-        f for f in ctx.open_findings
-        if (f.source or {}).get("tool_name") == "litellm"
-    ]
+    open_litellm = ctx.open_litellm_findings
     if open_litellm:
         return (
             False,
@@ -1602,7 +1691,6 @@ def _check_findings_clear(ctx: _EvalContext, keywords: list[str], label: str):
 
 def _check_findings_by_tool(ctx: _EvalContext, tool_type: str, label: str):
     """Return pass if at least one finding from the given tool type exists (scan ran)."""
-    hits = [f for f in ctx.open_findings if (f.source or {}).get("tool_type") == tool_type]
     all_hits = ctx.findings_by_source.get(tool_type, [])
     ran = len(all_hits) > 0
     return ran, f"{label}: scan completed ({len(all_hits)} finding(s) processed)" if ran else f"{label}: no {tool_type} scan results found", None
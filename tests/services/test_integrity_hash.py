@@ -0,0 +1,50 @@
+"""Tests for detached integrity hash verification and canonicalization compat."""
+
+import hashlib
+import json
+
+from pearl.services.compiler.integrity import (
+    canonical_json,
+    legacy_canonical_json,
+    verify_detached_hash,
+)
+
+
+def test_current_hash_verifies():
+    """Hash computed over the current canonical form → (valid, not stale)."""
+    body = {"project_identity": {"name": "demo"}, "rules": [1, 2, 3]}
+    stored = hashlib.sha256(canonical_json(body)).hexdigest()
+    assert verify_detached_hash(stored, body) == (True, False)
+
+
+def test_legacy_stdlib_hash_verifies_as_stale():
+    """Pre-orjson packages hashed stdlib-escaped bytes — still valid, flagged stale."""
+    body = {"project_identity": {"name": "Überwachung", "owner": "équipe"}}
+    # Canonical forms genuinely differ for non-ASCII payloads
+    assert canonical_json(body) != legacy_canonical_json(body)
+    stored = hashlib.sha256(legacy_canonical_json(body)).hexdigest()
+    assert verify_detached_hash(stored, body) == (True, True)
+
+
+def test_ascii_payload_canonical_forms_match():
+    """For ASCII-only payloads the two canonicalizations are byte-identical."""
+    body = {"b": 1, "a": {"nested": True}}
+    assert canonical_json(body) == legacy_canonical_json(body)
+
+
+def test_legacy_canonical_json_escapes_non_ascii():
+    """Legacy form matches the original json.dumps(sort_keys, compact) bytes."""
+    body = {"name": "naïve"}
+    expected = json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    assert legacy_canonical_json(body) == expected
+    assert b"\\u" in legacy_canonical_json(body)
+
+
+def test_tampered_hash_fails_both_forms():
+    """A hash matching neither canonicalization is a genuine mismatch."""
+    body = {"project_identity": {"name": "demo"}}
+    assert verify_detached_hash("0" * 64, body) == (False, False)
+
+
+def test_missing_hash_is_invalid_not_stale():
+    assert verify_detached_hash(None, {"a": 1}) == (False, False)
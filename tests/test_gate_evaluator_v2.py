@@ -303,3 +303,71 @@ async def test_bu_framework_requirements_visible_in_evaluation(client, db_sessio
         if (rr.get("details") or {}).get("framework") == "owasp_llm"
     ]
     assert len(owasp_rules) >= 1, "Expected at least one owasp_llm framework rule from BU"
+
+
+# ---------------------------------------------------------------------------
+# fast_fail short-circuit
+# ---------------------------------------------------------------------------
+
+async def _seed_bare_project(session: AsyncSession, project_id: str) -> str:
+    """Create an unprovisioned project so most gate rules fail."""
+    from datetime import datetime, timezone
+    from pearl.db.models.project import ProjectRow
+
+    session.add(ProjectRow(
+        project_id=project_id,
+        name="Fast Fail Test Project",
+        owner_team="test-team",
+        business_criticality="medium",
+        external_exposure="internal",
+        ai_enabled=True,
+        schema_version="1.1",
+        current_environment="pilot",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    ))
+    await session.commit()
+    return project_id
+
+
+@pytest.mark.asyncio
+async def test_fast_fail_skips_rules_after_first_required_failure(db_session):
+    """fast_fail=True stops at the first failing required rule and records
+    the remaining rules as SKIP; overall status is still a failure."""
+    from pearl.models.promotion import GateEvaluationStatus, GateRuleResult
+    from pearl.services.promotion.gate_evaluator import evaluate_promotion
+
+    pid = await _seed_bare_project(db_session, "proj_fastfail_on")
+    evaluation = await evaluate_promotion(pid, session=db_session, fast_fail=True)
+
+    results = evaluation.rule_results
+    fail_positions = [i for i, r in enumerate(results) if r.result == GateRuleResult.FAIL]
+    assert fail_positions, "expected at least one failing rule on a bare project"
+    first_fail = fail_positions[0]
+
+    # Exactly one FAIL — evaluation short-circuited there
+    assert evaluation.failed_count == 1
+    # Everything after the failing rule is recorded as SKIP, with a message
+    remaining = results[first_fail + 1:]
+    assert remaining, "expected rules after the first failure to exist"
+    assert all(r.result == GateRuleResult.SKIP for r in remaining)
+    assert all("fast-fail" in r.message for r in remaining)
+    assert evaluation.skipped_count == len(remaining)
+    assert evaluation.total_count == len(results)
+    assert evaluation.status != GateEvaluationStatus.PASSED
+
+
+@pytest.mark.asyncio
+async def test_fast_fail_default_off_evaluates_every_rule(db_session):
+    """Without fast_fail, all rules are evaluated and none are skipped."""
+    from pearl.models.promotion import GateRuleResult
+    from pearl.services.promotion.gate_evaluator import evaluate_promotion
+
+    pid = await _seed_bare_project(db_session, "proj_fastfail_off")
+    evaluation = await evaluate_promotion(pid, session=db_session)
+
+    assert all(
+        r.result != GateRuleResult.SKIP for r in evaluation.rule_results
+    ), "default evaluation must not skip rules"
+    assert evaluation.failed_count >= 2  # a bare project fails more than one rule
+    assert evaluation.skipped_count == 0
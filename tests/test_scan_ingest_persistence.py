@@ -0,0 +1,83 @@
+"""Tests for scan finding persistence — bulk insert with per-row error isolation."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from pearl.scanning.service import ScanningService
+
+
+def _row(finding_id: str, title: str | None = "Test finding") -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "finding_id": finding_id,
+        "project_id": "proj_persist_test",
+        "environment": "dev",
+        "category": "security",
+        "severity": "low",
+        "title": title,
+        "source": {"tool_name": "pearl_scan_secrets", "tool_type": "pearl_ai"},
+        "full_data": {"finding_id": finding_id, "title": title},
+        "normalized": False,
+        "detected_at": now,
+        "batch_id": "batch_persist_test",
+        "cwe_ids": None,
+        "compliance_refs": None,
+        "status": "open",
+    }
+
+
+@pytest.fixture
+async def project(db_session):
+    from pearl.db.models.project import ProjectRow
+
+    row = ProjectRow(
+        project_id="proj_persist_test",
+        name="Persistence Test Project",
+        owner_team="test-team",
+        business_criticality="medium",
+        external_exposure="internal",
+        ai_enabled=True,
+        schema_version="1.1",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    db_session.add(row)
+    await db_session.commit()
+    return row.project_id
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_accepts_all_good_rows(project, db_session):
+    """A clean batch goes through the single bulk insert untouched."""
+    from pearl.repositories.finding_repo import FindingRepository
+
+    service = ScanningService()
+    repo = FindingRepository(db_session)
+    accepted, quarantined = await service._persist_finding_rows(
+        repo, [_row("find_bulk_a"), _row("find_bulk_b")]
+    )
+    assert (accepted, quarantined) == (2, 0)
+
+    persisted = await repo.get_by_ids(["find_bulk_a", "find_bulk_b"])
+    assert {r.finding_id for r in persisted} == {"find_bulk_a", "find_bulk_b"}
+
+
+@pytest.mark.asyncio
+async def test_bad_row_quarantines_only_itself(project, db_session):
+    """Bulk failure falls back to per-row inserts; one bad row is isolated."""
+    from pearl.repositories.finding_repo import FindingRepository
+
+    service = ScanningService()
+    repo = FindingRepository(db_session)
+    rows = [
+        _row("find_ok_1"),
+        _row("find_bad", title=None),  # violates NOT NULL → poisons the bulk insert
+        _row("find_ok_2"),
+    ]
+    accepted, quarantined = await service._persist_finding_rows(repo, rows)
+    assert (accepted, quarantined) == (2, 1)
+
+    # Good rows on either side of the bad one survive; the session stays usable
+    persisted = await repo.get_by_ids(["find_ok_1", "find_bad", "find_ok_2"])
+    assert {r.finding_id for r in persisted} == {"find_ok_1", "find_ok_2"}